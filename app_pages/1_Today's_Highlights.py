@@ -2,27 +2,47 @@
 
 import json
 import streamlit as st
-import pandas as pd
-from datetime import datetime, timedelta
 
 from utils.auth import check_password
 from utils.theme import inject_theme, styled_divider, styled_header, empty_state, COLORS, BORDERS, TYPOGRAPHY, SHADOWS, SPACING
+
+if not check_password():
+    st.stop()
+
+inject_theme()
+
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from components.cards import metric_card, quote_card
 from components.charts import quality_histogram, volume_trend, case_type_pie, trending_bar_chart
 from utils.constants import humanize, quality_band
 from utils.queries import (
-    get_weekly_metric_counts, get_prior_period_metrics, fetch_quotes, get_daily_volume,
-    get_last_updated, get_nsm_weekly_count, get_nsm_weekly_history,
+    get_weekly_metric_counts, get_prior_period_metrics, get_top_quotes, get_daily_volume,
+    get_last_updated, get_nsm_weekly_count, get_nsm_weekly_history, utc_cutoff,
 )
 from utils.database import query_table, get_supabase
 
-if not check_password():
-    st.stop()
+st.title(":bar_chart: Today's Highlights")
 
-inject_theme()
+# Every dashboard helper below is an independent round trip. Start them all
+# now and let each section block only on its own result, so the page waits
+# for the slowest query rather than the sum of them. Workers carry this
+# run's script context so the cached helpers run as they would inline. The
+# metric cards are left out: their helpers already fan out internally.
+_pool = ThreadPoolExecutor(
+    max_workers=5,
+    initializer=add_script_run_ctx,
+    initargs=(None, get_script_run_ctx()),
+)
+f_last_updated = _pool.submit(get_last_updated)
+f_nsm = _pool.submit(get_nsm_weekly_count)
+f_nsm_history = _pool.submit(get_nsm_weekly_history, 6)
+f_top_quotes = _pool.submit(get_top_quotes, 7, 5)
+f_daily = _pool.submit(get_daily_volume, 7)
+_pool.shutdown(wait=False)
 
-st.title(":bar_chart: Today's Highlights")
-_last_updated = get_last_updated()
+_last_updated = f_last_updated.result()
 if _last_updated:
     st.caption(f"Curated content picks for the creative team. · Data last updated: {_last_updated}")
 else:
@@ -31,7 +51,7 @@ else:
 client = get_supabase()
 
 # --- North Star Metric (top billboard) ---
-nsm = get_nsm_weekly_count()
+nsm = f_nsm.result()
 nsm_left, nsm_right = st.columns([2, 1])
 with nsm_left:
     if nsm["this_week"] == 0 and nsm["last_week"] == 0:
@@ -80,7 +100,7 @@ with nsm_left:
         )
 with nsm_right:
     # NSM sparkline (6-week history)
-    _sparkline_data = get_nsm_weekly_history(weeks=6)
+    _sparkline_data = f_nsm_history.result()
     _has_data = any(d["count"] > 0 for d in _sparkline_data)
     if _has_data:
         import plotly.graph_objects as go
@@ -115,8 +135,7 @@ styled_divider()
 
 # --- Section 1: Metric cards ---
 with st.spinner("Loading metrics..."):
-    metrics = get_weekly_metric_counts(days=7)
-    prior = get_prior_period_metrics(days=7)
+    metrics, prior = get_weekly_metric_counts(7), get_prior_period_metrics(7)
 
 col1, col2, col3, col4 = st.columns(4)
 with col1:
@@ -140,8 +159,7 @@ left, right = st.columns([3, 2])
 
 with left:
     styled_header("Top Quotes This Week")
-    week_cutoff = (datetime.utcnow() - timedelta(days=7)).isoformat()
-    top_quotes = fetch_quotes(min_quality=0, max_quality=100, limit=5, start_date=week_cutoff)
+    top_quotes = f_top_quotes.result()
     if top_quotes:
         for row in top_quotes:
             quote_card(row, show_copy=False)
@@ -151,7 +169,7 @@ with left:
 with right:
     styled_header("Trending This Week")
 
-    cutoff_7d = (datetime.utcnow() - timedelta(days=7)).isoformat()
+    cutoff_7d = utc_cutoff(7)
 
     # Top objection categories — bar chart
     try:
@@ -304,7 +322,7 @@ chart_left, chart_right = st.columns(2)
 
 with chart_left:
     styled_header("Call Volume", subtitle="Last 7 days")
-    daily = get_daily_volume(days=7)
+    daily = f_daily.result()
     if not daily.empty:
         try:
             fig = volume_trend(daily)
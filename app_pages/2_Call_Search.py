@@ -20,8 +20,10 @@ from components.filters import (
     has_quote_toggle, content_worthy_toggle, clear_filters,
 )
 from components.cards import call_card, call_detail_panel, _render_chat_transcript
-from components.pagination import paginated_controls
-from utils.queries import search_calls, get_call_detail, get_transcript, count_calls, get_last_updated
+from components.pagination import paginated_controls, page_cursor, record_next_cursor
+from utils.queries import (
+    search_calls, get_call_detail, get_transcript, count_calls, get_last_updated, CALLS_CURSOR_KEYS,
+)
 from utils.export import download_csv
 
 # --- Jump-to support from Data Explorer ---
@@ -52,6 +54,7 @@ _fkey = f"{text}|{case_types}|{min_q}|{max_q}|{start_date}|{end_date}|{languages
 if st.session_state.get("cs_page_filter_hash") != _fkey:
     st.session_state["cs_page"] = 0
     st.session_state["cs_page_filter_hash"] = _fkey
+    st.session_state.pop("cs_page_cursors", None)
 
 # --- Count + Pagination ---
 total = count_calls(
@@ -76,7 +79,9 @@ with st.spinner("Searching calls..."):
         content_worthy=content_worthy,
         limit=50,
         offset=offset,
+        cursor=page_cursor("cs_page", page),
     )
+record_next_cursor("cs_page", page, results, CALLS_CURSOR_KEYS)
 
 if not results:
     empty_state("&#128269;", "No calls found matching your filters.", "Try broadening your search criteria.")
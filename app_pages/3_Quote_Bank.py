@@ -1,6 +1,7 @@
 """Quote Bank — Find and copy quotes for campaigns."""
 
 import io
+from datetime import datetime
 import pandas as pd
 import streamlit as st
 from utils.auth import check_password
@@ -18,8 +19,8 @@ from components.filters import (
     language_filter, date_range_filter, testimonial_toggle, clear_filters,
 )
 from components.cards import quote_card
-from components.pagination import paginated_controls
-from utils.queries import fetch_quotes, count_quotes, get_last_updated
+from components.pagination import paginated_controls, page_cursor, record_next_cursor
+from utils.queries import fetch_quotes, count_quotes, get_last_updated, QUOTES_CURSOR_KEYS
 from utils.export import download_csv, generate_word_doc, format_quote_for_clipboard
 
 # --- Sidebar filters ---
@@ -43,6 +44,7 @@ _fkey = f"{test_only}|{tones}|{case_types}|{min_q}|{max_q}|{languages}|{start_da
 if st.session_state.get("qb_page_filter_hash") != _fkey:
     st.session_state["qb_page"] = 0
     st.session_state["qb_page_filter_hash"] = _fkey
+    st.session_state.pop("qb_page_cursors", None)
 
 # --- Count + Pagination ---
 total = count_quotes(
@@ -66,7 +68,9 @@ with st.spinner("Loading quotes..."):
         end_date=str(end_date) if end_date else None,
         limit=50,
         offset=offset,
+        cursor=page_cursor("qb_page", page),
     )
+record_next_cursor("qb_page", page, quotes, QUOTES_CURSOR_KEYS)
 
 if not quotes:
     empty_state("&#128172;", "No quotes found matching your filters.", "Try broadening your search criteria.")
@@ -88,8 +92,7 @@ else:
     _export_rows = sel_rows if sel_rows else quotes
     _export_label = f"Word ({sel_count} selected)" if sel_rows else f"Word ({len(quotes)} visible)"
     try:
-        from datetime import datetime as _dt
-        _doc_title = f"Quote Export — {_dt.now().strftime('%b %d, %Y')}"
+        _doc_title = f"Quote Export — {datetime.now().strftime('%b %d, %Y')}"
         _blocks = []
         for _r in _export_rows:
             _q = _r.get("key_quote", "")
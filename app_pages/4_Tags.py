@@ -1,6 +1,7 @@
 """Tags — Tag taxonomy browser + objection category insights."""
 
 import json
+
 import streamlit as st
 import pandas as pd
 from utils.auth import check_password
@@ -15,6 +16,7 @@ st.title(":label: Tags & Objection Insights")
 st.caption("Browse the tag taxonomy and explore objection patterns.")
 
 from utils.database import get_supabase, query_table
+from utils.queries import utc_cutoff
 from components.charts import objection_bar
 from components.cards import call_card
 
@@ -86,7 +88,7 @@ def _show_fallback_tags():
         styled_header(f"Calls tagged: {active_tag}")
         if st.button("Clear filter", key="clear_tag_filter"):
             del st.session_state["tag_filter"]
-            st.rerun()
+            st.rerun(scope="fragment")
         try:
             _client = get_supabase()
             tagged_rows = (
@@ -112,45 +114,57 @@ def _show_fallback_tags():
 
 
 # --- Section 1: Tag Browser ---
-styled_header("Tag Browser")
+# Isolated in a fragment: the tag search box and tag buttons only rerun this
+# section, not the objection queries below.
+@st.fragment
+def _tag_browser_section():
+    styled_header("Tag Browser")
 
-with st.spinner("Loading tags..."):
-    try:
-        taxonomy = query_table("master_taxonomy", order="tag_name")
-        if taxonomy:
-            id_to_name: dict[int, str] = {}
-            for t in taxonomy:
-                tid = t.get("tag_id")
-                if tid is not None:
-                    id_to_name[tid] = t.get("tag_name", f"Tag {tid}")
-
-            parents: dict[int, list] = {}
-            orphans = []
-            for t in taxonomy:
-                parent_id = t.get("parent_tag_id")
-                if parent_id is not None:
-                    parents.setdefault(parent_id, []).append(t)
-                else:
-                    orphans.append(t)
-
-            for parent_id, children in sorted(parents.items(), key=lambda x: id_to_name.get(x[0], "")):
-                parent_name = id_to_name.get(parent_id, f"Category {parent_id}")
-                with st.expander(f"{parent_name} ({len(children)} tags)"):
-                    for child in children:
-                        tag = child.get("tag_name", "")
-                        count = child.get("usage_count", 0)
-                        st.caption(f"  {tag} \u2014 {count} uses")
-
-            if orphans:
-                st.markdown("**Top-level tags:**")
-                for t in orphans:
-                    tag = t.get("tag_name", "")
-                    count = t.get("usage_count", 0)
-                    st.caption(f"  {tag} \u2014 {count} uses")
-        else:
+    with st.spinner("Loading tags..."):
+        try:
+            taxonomy = query_table("master_taxonomy", order="tag_name")
+            if taxonomy:
+                # Rows arrive ordered by tag_name, so seeding one group per tag
+                # in that order leaves the parent groups name-sorted for free.
+                id_to_name: dict[int, str] = {}
+                parents: dict[int, list] = {}
+                for t in taxonomy:
+                    tid = t.get("tag_id")
+                    if tid is not None:
+                        id_to_name[tid] = t.get("tag_name", f"Tag {tid}")
+                        parents[tid] = []
+
+                orphans = []
+                for t in taxonomy:
+                    parent_id = t.get("parent_tag_id")
+                    if parent_id is not None:
+                        parents.setdefault(parent_id, []).append(t)
+                    else:
+                        orphans.append(t)
+
+                for parent_id, children in parents.items():
+                    if not children:
+                        continue
+                    parent_name = id_to_name.get(parent_id, f"Category {parent_id}")
+                    with st.expander(f"{parent_name} ({len(children)} tags)"):
+                        st.caption("  \n".join(
+                            f"{child.get('tag_name', '')} \u2014 {child.get('usage_count', 0)} uses"
+                            for child in children
+                        ))
+
+                if orphans:
+                    st.markdown("**Top-level tags:**")
+                    st.caption("  \n".join(
+                        f"{t.get('tag_name', '')} \u2014 {t.get('usage_count', 0)} uses"
+                        for t in orphans
+                    ))
+            else:
+                _show_fallback_tags()
+        except Exception:
             _show_fallback_tags()
-    except Exception:
-        _show_fallback_tags()
+
+
+_tag_browser_section()
 
 
 # --- Section 2: Objection Category Insights ---
@@ -188,30 +202,28 @@ with st.spinner("Loading objection data..."):
                 st.caption("Chart unavailable.")
 
             if "freq_this_week" in obj_df.columns and "freq_last_week" in obj_df.columns:
-                total_this = sum((row.get("freq_this_week") or 0) for _, row in obj_df.iterrows())
-                total_last = sum((row.get("freq_last_week") or 0) for _, row in obj_df.iterrows())
+                this_w = pd.to_numeric(obj_df["freq_this_week"], errors="coerce").fillna(0).astype(int)
+                last_w = pd.to_numeric(obj_df["freq_last_week"], errors="coerce").fillna(0).astype(int)
+                total_this = this_w.sum()
+                total_last = last_w.sum()
                 has_baseline = total_last > 0 and total_last >= total_this * 0.10
                 if has_baseline:
-                    _skip = {"undefined", "none", "null", "n/a", ""}
                     st.markdown("**Week-over-week changes:**")
-                    for _, row in obj_df.iterrows():
-                        _cat_raw = row.get("obj_category")
-                        if not isinstance(_cat_raw, str) or _cat_raw.strip().lower() in _skip:
-                            continue
-                        this_w = row.get("freq_this_week", 0) or 0
-                        last_w = row.get("freq_last_week", 0) or 0
-                        delta = this_w - last_w
-                        arrow = "+" if delta > 0 else ""
-                        cat_label = _cat_raw.replace("_", " ").title()
-                        st.caption(
-                            f"  {cat_label}: {this_w} this week "
-                            f"({arrow}{delta} vs last week)"
-                        )
+                    # obj_df is already stripped of junk categories above, so
+                    # build every line with vectorized string ops and emit once.
+                    delta = this_w - last_w
+                    cat_label = obj_df["obj_category"].str.replace("_", " ").str.title()
+                    lines = (
+                        cat_label + ": " + this_w.astype(str) + " this week ("
+                        + delta.gt(0).map({True: "+", False: ""}) + delta.astype(str)
+                        + " vs last week)"
+                    )
+                    if not lines.empty:
+                        st.caption(lines.str.cat(sep="  \n"))
                 else:
                     st.caption("*Trend comparison collecting \u2014 check back next week once a baseline week of data is available.*")
         else:
-            from datetime import datetime, timedelta
-            cutoff_7d = (datetime.utcnow() - timedelta(days=7)).isoformat()
+            cutoff_7d = utc_cutoff(7)
 
             rows = (
                 client.table("analysis_results")
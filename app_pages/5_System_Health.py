@@ -1,7 +1,8 @@
 """System Health — Admin-only engineering metrics and model health."""
 
-import streamlit as st
+import numpy as np
 import pandas as pd
+import streamlit as st
 from utils.auth import check_password, check_admin
 from utils.theme import inject_theme, styled_divider, styled_header, COLORS
 
@@ -15,6 +16,7 @@ st.caption("Engineering metrics, model health, and cost tracking.")
 
 from utils.queries import (
     get_system_status, get_cost_tracking, get_drift_alerts, get_prompt_library,
+    get_recent_throughput,
 )
 from utils.database import get_supabase
 
@@ -36,19 +38,10 @@ else:
 # Read-only summary for all users
 with st.spinner("Loading summary..."):
     try:
-        from datetime import datetime, timedelta
-        _cutoff_7d = (datetime.utcnow() - timedelta(days=7)).isoformat()
-        _summary_rows = (
-            get_supabase().table("analysis_results")
-            .select("quality_score", count="exact")
-            .gte("analyzed_at", _cutoff_7d)
-            .limit(10000)
-            .execute()
-        )
-        _total_7d = _summary_rows.count or 0
+        _summary = get_recent_throughput(days=7)
+        _total_7d = _summary["total"]
         _avg_daily = _total_7d / 7 if _total_7d else 0
-        _scores = [r["quality_score"] for r in (_summary_rows.data or []) if r.get("quality_score") is not None]
-        _avg_quality = sum(_scores) / len(_scores) if _scores else 0
+        _avg_quality = _summary["avg_quality"]
 
         from components.cards import metric_card
         cols = st.columns(3)
@@ -75,6 +68,9 @@ if not check_admin():
     )
     st.stop()
 
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from utils.database import query_table, query_df
 from components.charts import (
     cost_trend, quality_violin, quality_histogram, scatter_calibration,
@@ -85,9 +81,42 @@ client = get_supabase()
 from utils.theme import inject_plotly_title_fix
 inject_plotly_title_fix()
 
+
+def _fetch_quality_rows() -> list[dict]:
+    return (
+        client.table("analysis_results")
+        .select("quality_score, confidence_score")
+        .not_.is_("quality_score", "null")
+        .order("analyzed_at", desc=True)
+        .limit(10000)
+        .execute()
+        .data
+    )
+
+
+# Every section below is an independent blocking HTTPS round trip. Fire them
+# all at once so the page waits for the slowest query, not the sum of them.
+# Workers carry this run's script context for the cached helpers.
+with st.spinner("Loading system health..."):
+    with ThreadPoolExecutor(
+        max_workers=8,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as _pool:
+        f_status = _pool.submit(get_system_status)
+        f_cost = _pool.submit(get_cost_tracking, 30)
+        f_quality = _pool.submit(_fetch_quality_rows)
+        f_alerts = _pool.submit(get_drift_alerts, 10)
+        f_gold = _pool.submit(
+            query_table, "arbitrated_labels",
+            select="production_quality_score, consensus_quality_score",
+        )
+        f_throughput = _pool.submit(get_recent_throughput, 7)
+        f_prompts = _pool.submit(get_prompt_library)
+
 # --- System Status ---
 styled_header("System Status")
-status = get_system_status()
+status = f_status.result()
 if status:
     is_active = status.get("system_active", False)
     try:
@@ -117,7 +146,7 @@ styled_divider()
 
 # --- Cost Tracking ---
 styled_header("Cost Tracking", subtitle="Last 30 days")
-cost_df = get_cost_tracking(days=30)
+cost_df = f_cost.result()
 if not cost_df.empty and "date" in cost_df.columns and "total_cost" in cost_df.columns:
     try:
         fig = cost_trend(cost_df)
@@ -125,16 +154,23 @@ if not cost_df.empty and "date" in cost_df.columns and "total_cost" in cost_df.c
     except Exception:
         st.caption("Chart unavailable.")
 
-    cost_df["total_cost"] = pd.to_numeric(cost_df["total_cost"], errors="coerce").fillna(0)
+    # Cast once to a NumPy array; sum/mean then scan it directly.
+    costs = pd.to_numeric(cost_df["total_cost"], errors="coerce").to_numpy(
+        dtype="float32", na_value=0.0,
+    )
     cols = st.columns(3)
-    total = cost_df["total_cost"].sum()
-    avg_daily = cost_df["total_cost"].mean()
+    total = float(costs.sum())
+    avg_daily = float(costs.mean())
     with cols[0]:
         metric_card("Total (30d)", f"${total:.2f}", color=COLORS["primary"])
     with cols[1]:
         metric_card("Avg daily", f"${avg_daily:.2f}", color=COLORS["info"])
     if "calls_processed" in cost_df.columns:
-        total_calls = cost_df["calls_processed"].sum()
+        total_calls = int(
+            pd.to_numeric(cost_df["calls_processed"], errors="coerce")
+            .to_numpy(dtype="int64", na_value=0)
+            .sum()
+        )
         with cols[2]:
             metric_card("Calls processed (30d)", f"{total_calls:,}", color=COLORS["success"])
 else:
@@ -144,73 +180,71 @@ styled_divider()
 
 # --- Quality Analytics ---
 styled_header("Quality Distribution")
-with st.spinner("Loading quality analytics..."):
-    try:
-        q_rows = (
-            client.table("analysis_results")
-            .select("quality_score, confidence_score")
-            .not_.is_("quality_score", "null")
-            .order("analyzed_at", desc=True)
-            .limit(10000)
-            .execute()
-            .data
-        )
-        if q_rows:
-            qdf = pd.DataFrame(q_rows)
-            left, right = st.columns(2)
-            with left:
-                st.markdown("**Quality Score (violin)**")
-                fig = quality_violin(qdf)
-                st.plotly_chart(fig, use_container_width=True)
-            with right:
-                st.markdown("**Quality Score (histogram)**")
-                fig = quality_histogram(qdf)
-                st.plotly_chart(fig, use_container_width=True)
-
-            if "confidence_score" in qdf.columns:
-                st.markdown("**Confidence Score Distribution**")
-                conf_df = qdf[qdf["confidence_score"].notna()].copy()
-                if not conf_df.empty:
-                    import plotly.express as _px
-                    from components.charts import _apply_template
-                    conf_counts = conf_df["confidence_score"].value_counts().sort_index().reset_index()
+try:
+    q_rows = f_quality.result()
+    if q_rows:
+        qdf = pd.DataFrame(q_rows)
+        left, right = st.columns(2)
+        with left:
+            st.markdown("**Quality Score (violin)**")
+            fig = quality_violin(qdf)
+            st.plotly_chart(fig, use_container_width=True, config={"responsive": True})
+        with right:
+            st.markdown("**Quality Score (histogram)**")
+            fig = quality_histogram(qdf)
+            st.plotly_chart(fig, use_container_width=True, config={"responsive": True})
+
+        if "confidence_score" in qdf.columns:
+            st.markdown("**Confidence Score Distribution**")
+            conf_df = qdf[qdf["confidence_score"].notna()].copy()
+            if not conf_df.empty:
+                import plotly.express as _px
+                from components.charts import _apply_template
+                conf = pd.to_numeric(conf_df["confidence_score"], errors="coerce").dropna()
+                if conf.nunique() > 50:
+                    # Continuous scores: one bar per distinct float is unreadable
+                    # and slow to draw, so bucket into 50 fixed-width bins.
+                    hist, edges = np.histogram(conf.to_numpy(dtype="float32"), bins=50)
+                    conf_counts = pd.DataFrame({
+                        "confidence_score": (edges[:-1] + edges[1:]) / 2,
+                        "count": hist,
+                    })
+                else:
+                    conf_counts = conf.value_counts().sort_index().reset_index()
                     conf_counts.columns = ["confidence_score", "count"]
-                    fig_conf = _px.bar(conf_counts, x="confidence_score", y="count",
-                                       labels={"confidence_score": "Confidence Score", "count": "Count"})
-                    fig_conf = _apply_template(fig_conf, height=250, showlegend=False)
-                    st.plotly_chart(fig_conf, use_container_width=True)
-        else:
-            st.caption("No quality data available.")
-    except Exception:
-        st.caption("Unable to load quality data.")
+                fig_conf = _px.bar(conf_counts, x="confidence_score", y="count",
+                                   labels={"confidence_score": "Confidence Score", "count": "Count"})
+                fig_conf = _apply_template(fig_conf, height=250, showlegend=False)
+                st.plotly_chart(fig_conf, use_container_width=True)
+    else:
+        st.caption("No quality data available.")
+except Exception:
+    st.caption("Unable to load quality data.")
 
 styled_divider()
 
 # --- Drift Alerts ---
 styled_header("Drift Alerts")
-alerts = get_drift_alerts(limit=10)
+alerts = f_alerts.result()
 if alerts:
-    for alert in alerts:
+    # Classify every alert in one vectorized pass; the loop below only renders.
+    adf = pd.DataFrame(alerts)
+    dev = (
+        pd.to_numeric(adf["max_deviation"], errors="coerce").fillna(0).to_numpy()
+        if "max_deviation" in adf.columns
+        else np.zeros(len(adf))
+    )
+    levels = [dev > 3, dev > 2]
+    severities = np.select(levels, ["High", "Medium"], default="Low")
+    badge_variants = np.select(levels, ["error", "warning"], default="info")
+    for alert, max_dev, severity, badge_variant in zip(alerts, dev, severities, badge_variants):
         created = str(alert.get("created_at", ""))[:10]
-        try:
-            max_dev = float(alert.get("max_deviation") or 0)
-        except (TypeError, ValueError):
-            max_dev = 0.0
         report = alert.get("drift_report", "")
-        if max_dev and max_dev > 3:
-            severity = "High"
-            badge_class = "wb-badge wb-badge-error"
-        elif max_dev and max_dev > 2:
-            severity = "Medium"
-            badge_class = "wb-badge wb-badge-warning"
-        else:
-            severity = "Low"
-            badge_class = "wb-badge wb-badge-info"
 
         label = f"{created} \u2014 {severity} ({max_dev:.1f}\u03c3)" if max_dev else created
         with st.expander(label):
             st.markdown(
-                f'<span class="{badge_class}">{severity}</span>',
+                f'<span class="wb-badge" data-variant="{badge_variant}">{severity}</span>',
                 unsafe_allow_html=True,
             )
             st.markdown(report if report else "No report available.")
@@ -222,9 +256,11 @@ styled_divider()
 # --- Model Calibration (from arbitrated_labels) ---
 styled_header("Model Calibration", subtitle="Grok vs Consensus")
 try:
-    gold = query_table("arbitrated_labels", select="production_quality_score, consensus_quality_score")
+    gold = f_gold.result()
     if gold and len(gold) > 5:
-        gold_df = pd.DataFrame(gold)
+        gold_df = pd.DataFrame(
+            gold, columns=["production_quality_score", "consensus_quality_score"],
+        ).astype("float32")
         gold_df = gold_df.rename(columns={
             "production_quality_score": "production_score",
             "consensus_quality_score": "consensus_score",
@@ -232,7 +268,7 @@ try:
         gold_df = gold_df.dropna()
         if not gold_df.empty:
             fig = scatter_calibration(gold_df)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config={"responsive": True})
             st.caption(f"{len(gold_df)} calibration labels")
         else:
             st.caption("No calibration data available.")
@@ -245,37 +281,27 @@ styled_divider()
 
 # --- Pipeline Throughput ---
 styled_header("Pipeline Throughput", subtitle="Last 7 days")
-with st.spinner("Loading throughput data..."):
-    try:
-        from datetime import datetime, timedelta
-        cutoff = (datetime.utcnow() - timedelta(days=7)).isoformat()
-        rows = (
-            client.table("analysis_results")
-            .select("analyzed_at, validation_passed, confidence_score", count="exact")
-            .gte("analyzed_at", cutoff)
-            .limit(10000)
-            .execute()
-        )
-        total = rows.count or 0
-        data = rows.data or []
-        passed = sum(1 for r in data if r.get("validation_passed") is True)
-        pass_rate = (passed / total * 100) if total else 0
+try:
+    throughput = f_throughput.result()
+    total = throughput["total"]
+    passed = throughput["passed"]
+    pass_rate = (passed / total * 100) if total else 0
 
-        cols = st.columns(3)
-        with cols[0]:
-            metric_card("Processed (7d)", f"{total:,}", color=COLORS["primary"])
-        with cols[1]:
-            metric_card("Avg/day", f"{total / 7:.0f}", color=COLORS["info"])
-        with cols[2]:
-            metric_card("Validation pass rate", f"{pass_rate:.1f}%", color=COLORS["success"])
-    except Exception:
-        st.caption("Throughput data unavailable.")
+    cols = st.columns(3)
+    with cols[0]:
+        metric_card("Processed (7d)", f"{total:,}", color=COLORS["primary"])
+    with cols[1]:
+        metric_card("Avg/day", f"{total / 7:.0f}", color=COLORS["info"])
+    with cols[2]:
+        metric_card("Validation pass rate", f"{pass_rate:.1f}%", color=COLORS["success"])
+except Exception:
+    st.caption("Throughput data unavailable.")
 
 styled_divider()
 
 # --- Active Prompts ---
 styled_header("Active Prompts")
-prompts = get_prompt_library()
+prompts = f_prompts.result()
 if prompts:
     active = [p for p in prompts if p.get("is_active")]
     if active:
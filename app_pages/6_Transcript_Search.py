@@ -76,11 +76,11 @@ if submitted and keyword.strip():
 
             # Quality badge
             if quality >= 75:
-                q_class = "wb-badge-success"
+                q_variant = "success"
             elif quality >= 50:
-                q_class = "wb-badge-warning"
+                q_variant = "warning"
             else:
-                q_class = "wb-badge-error"
+                q_variant = "error"
 
             # Format date
             date_str = ""
@@ -121,8 +121,8 @@ if submitted and keyword.strip():
                 f"""
                 <div class="wb-quote-card" style="margin-bottom:12px;">
                     <div class="wb-pill-row">
-                        <span class="wb-badge {q_class}">Quality: {quality}</span>
-                        <span class="wb-badge wb-badge-info">{_esc(case_type)}</span>
+                        <span class="wb-badge" data-variant="{q_variant}">Quality: {quality}</span>
+                        <span class="wb-badge" data-variant="info">{_esc(case_type)}</span>
                         {date_html}
                         {match_html}
                     </div>
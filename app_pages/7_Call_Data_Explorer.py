@@ -18,8 +18,10 @@ from components.filters import (
     case_type_filter, quality_range_filter, date_range_filter, language_filter,
 )
 from components.cards import call_detail_panel, _render_chat_transcript
-from components.pagination import paginated_controls
-from utils.queries import fetch_explorer_data, get_call_detail, get_transcript, count_explorer_rows
+from components.pagination import paginated_controls, page_cursor, record_next_cursor
+from utils.queries import (
+    fetch_explorer_data, get_call_detail, get_transcript, count_explorer_rows, CALLS_CURSOR_KEYS,
+)
 from utils.export import download_csv
 from utils.constants import COLUMN_GROUPS, humanize
 
@@ -39,19 +41,12 @@ with st.sidebar:
             group_name, value=default_on, key=f"cg_{group_name}"
         )
 
-# Build column list from active groups
-columns = []
-for group_name, is_active in active_groups.items():
-    if is_active:
-        columns.extend(COLUMN_GROUPS[group_name])
-# Deduplicate while preserving order
-seen = set()
-unique_columns = []
-for c in columns:
-    if c not in seen:
-        seen.add(c)
-        unique_columns.append(c)
-columns = unique_columns
+# Build column list from active groups (deduplicated, order preserved)
+columns = list(dict.fromkeys(
+    c
+    for group_name, is_active in active_groups.items() if is_active
+    for c in COLUMN_GROUPS[group_name]
+))
 
 if not columns:
     st.warning("Select at least one column group.")
@@ -62,6 +57,7 @@ _fkey = f"{case_types}|{min_q}|{max_q}|{start_date}|{end_date}|{languages}"
 if st.session_state.get("ex_page_filter_hash") != _fkey:
     st.session_state["ex_page"] = 0
     st.session_state["ex_page_filter_hash"] = _fkey
+    st.session_state.pop("ex_page_cursors", None)
 
 # --- Count + Pagination ---
 total = count_explorer_rows(
@@ -82,7 +78,10 @@ with st.spinner("Loading data..."):
         languages=languages,
         limit=50,
         offset=offset,
+        cursor=page_cursor("ex_page", page),
     )
+if set(CALLS_CURSOR_KEYS).issubset(df.columns):
+    record_next_cursor("ex_page", page, df.tail(1).to_dict("records"), CALLS_CURSOR_KEYS)
 
 if df.empty:
     empty_state("&#128203;", "No data found matching your filters.", "Try broadening your filter criteria.")
@@ -98,22 +97,22 @@ else:
     # Export
     download_csv(df, filename="walker_brain_explorer.csv")
 
-    # Render table with NULL handling
+    # Render table with NULL handling. Only object columns can hold None or
+    # nested JSON (numeric columns carry NULL as NaN), so the rest are skipped
+    # and json.dumps only runs on the cells that actually need it.
     display_df = df.copy()
-    for col in display_df.columns:
-        display_df[col] = display_df[col].apply(
-            lambda x: (
-                json.dumps(x, indent=1) if isinstance(x, (list, dict))
-                else "\u2014" if x is None
-                else x
-            )
-        )
+    for col in display_df.select_dtypes(include="object").columns:
+        s = display_df[col]
+        nested = s.map(type).isin((list, dict))
+        if nested.any():
+            s = s.where(~nested, s[nested].map(lambda x: json.dumps(x, indent=1)))
+        display_df[col] = s.where(s.notna(), "\u2014")
 
     # Truncate source_transcript_id to 8 chars
     if "source_transcript_id" in display_df.columns:
-        display_df["source_transcript_id"] = display_df["source_transcript_id"].apply(
-            lambda x: (x[:8] + "\u2026") if isinstance(x, str) and len(x) > 8 else x
-        )
+        ids = display_df["source_transcript_id"]
+        long_ids = ids.str.len().gt(8).fillna(False)
+        display_df["source_transcript_id"] = ids.where(~long_ids, ids.str[:8] + "\u2026")
 
     # Pretty-print quality_sub_scores as compact readable string
     if "quality_sub_scores" in display_df.columns:
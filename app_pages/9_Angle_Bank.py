@@ -1,10 +1,17 @@
 """Angle Bank — Browse and filter creative angle briefs from WF 20."""
 
 import json
+from datetime import datetime, timedelta
 from html import escape as _esc
 import streamlit as st
 from utils.auth import check_password, get_current_user
 from utils.theme import inject_theme, styled_divider, empty_state, COLORS, TYPOGRAPHY, SPACING, SHADOWS, BORDERS
+
+if not check_password():
+    st.stop()
+
+inject_theme()
+
 from utils.database import query_table
 from utils.constants import CONTENT_TYPE_COLORS, INTENT_COLORS, FUNNEL_COLORS
 from utils.queries import (
@@ -12,11 +19,6 @@ from utils.queries import (
 )
 from components.pagination import paginated_controls
 
-if not check_password():
-    st.stop()
-
-inject_theme()
-
 st.title(":bulb: Angle Bank")
 st.caption("Creative angle briefs generated from high-quality intake calls.")
 
@@ -228,7 +230,6 @@ with st.sidebar:
     min_q, max_q = st.slider("Quality Score", 0, 100, (70, 100), key="ab_quality")
 
     # Date range
-    from datetime import datetime, timedelta
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input(
@@ -5,7 +5,7 @@ from html import escape as _esc
 import streamlit as st
 from utils.constants import (
     quality_band, clean_language, TESTIMONIAL_TYPE_LABELS,
-    humanize, format_case_value, get_badge_class, is_falsy_sentinel,
+    humanize, format_case_value, get_badge_variant, is_falsy_sentinel,
 )
 from utils.theme import COLORS, TYPOGRAPHY, SPACING, SHADOWS, BORDERS
 
@@ -34,9 +34,9 @@ def metric_card(label: str, value, delta=None, color: str | None = None):
         st.metric(label=label, value=value, delta=delta)
 
 
-def _badge_pill(text: str, css_class: str) -> str:
+def _badge_pill(text: str, variant: str) -> str:
     """Return HTML for a single badge pill."""
-    return f'<span class="wb-badge {css_class}">{_esc(text)}</span>'
+    return f'<span class="wb-badge" data-variant="{variant}">{_esc(text)}</span>'
 
 
 def quote_card(row: dict, show_copy: bool = True):
@@ -52,7 +52,7 @@ def quote_card(row: dict, show_copy: bool = True):
     testimonial_type = row.get("testimonial_type", "")
 
     band_name, band_color = quality_band(quality)
-    tone_class = get_badge_class(tone)
+    tone_variant = get_badge_variant(tone)
 
     if isinstance(tags, str):
         try:
@@ -69,17 +69,17 @@ def quote_card(row: dict, show_copy: bool = True):
     # Badge pills row
     pills = []
     if case_type:
-        pills.append(_badge_pill(case_type, "wb-badge-info"))
+        pills.append(_badge_pill(case_type, "info"))
     if tone:
-        pills.append(_badge_pill(tone, tone_class))
+        pills.append(_badge_pill(tone, tone_variant))
     if quality is not None:
         # Map quality band to badge class
-        q_class = "wb-badge-error" if band_name in ("POOR", "NEEDS IMPROVEMENT") else \
-                  "wb-badge-warning" if band_name == "ADEQUATE" else \
-                  "wb-badge-success" if band_name in ("STRONG", "EXCEPTIONAL") else "wb-badge-info"
-        pills.append(_badge_pill(f"Quality: {quality}", q_class))
+        q_variant = "error" if band_name in ("POOR", "NEEDS IMPROVEMENT") else \
+                    "warning" if band_name == "ADEQUATE" else \
+                    "success" if band_name in ("STRONG", "EXCEPTIONAL") else "info"
+        pills.append(_badge_pill(f"Quality: {quality}", q_variant))
     if lang_short:
-        pills.append(_badge_pill(lang_short, "wb-badge-info"))
+        pills.append(_badge_pill(lang_short, "info"))
     pills_html = f'<div class="wb-pill-row">{"".join(pills)}</div>' if pills else ""
 
     # Build meta line
@@ -126,7 +126,7 @@ def call_card(row: dict):
     case_value_cat = row.get("estimated_case_value_category", "") or ""
 
     band_name, band_color = quality_band(quality)
-    tone_class = get_badge_class(tone)
+    tone_variant = get_badge_variant(tone)
 
     if isinstance(tags, str):
         try:
@@ -141,15 +141,15 @@ def call_card(row: dict):
         cols[0].markdown(f"**{case_type}**")
         if case_value_cat and not is_falsy_sentinel(case_value_cat):
             cols[0].caption(f"Case value: {case_value_cat}")
-        q_class = "wb-badge-error" if band_name in ("POOR", "NEEDS IMPROVEMENT") else \
-                  "wb-badge-warning" if band_name == "ADEQUATE" else \
-                  "wb-badge-success" if band_name in ("STRONG", "EXCEPTIONAL") else "wb-badge-info"
+        q_variant = "error" if band_name in ("POOR", "NEEDS IMPROVEMENT") else \
+                    "warning" if band_name == "ADEQUATE" else \
+                    "success" if band_name in ("STRONG", "EXCEPTIONAL") else "info"
         cols[1].markdown(
-            _badge_pill(f"Quality: {quality}", q_class),
+            _badge_pill(f"Quality: {quality}", q_variant),
             unsafe_allow_html=True,
         )
         cols[2].markdown(
-            _badge_pill(humanize(tone) if tone else "\u2014", tone_class),
+            _badge_pill(humanize(tone) if tone else "\u2014", tone_variant),
             unsafe_allow_html=True,
         )
         cols[3].caption(date)
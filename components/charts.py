@@ -2,9 +2,15 @@
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 from utils.constants import QUALITY_BANDS, CASE_TYPE_COLORS
-from utils.theme import PLOTLY_TEMPLATE, COLORS
+from utils.theme import PLOTLY_COLORWAY, PLOTLY_TEMPLATE, COLORS
+
+# Validated once at import; figures reference it by name instead of
+# re-validating the full layout dict on every build.
+pio.templates["walker_brain"] = go.layout.Template(layout=go.Layout(**PLOTLY_TEMPLATE))
+pio.templates.default = "walker_brain"
 
 
 def _hex_to_rgba(hex_color: str, alpha: float) -> str:
@@ -16,12 +22,12 @@ def _hex_to_rgba(hex_color: str, alpha: float) -> str:
 
 def _apply_template(fig: go.Figure, **overrides) -> go.Figure:
     """Apply the shared Plotly template with optional per-chart overrides."""
-    layout = {**PLOTLY_TEMPLATE, **overrides}
+    layout = dict(overrides)
     # Always normalise title into an explicit dict to prevent Plotly.js
     # rendering "undefined" when it receives a bare string or missing value.
     raw_title = layout.pop("title", layout.pop("title_text", None))
-    title_font_size = layout.pop("title_font_size", 14)
-    title_font_color = layout.pop("title_font_color", COLORS["text_primary"])
+    title_font_size = layout.pop("title_font_size", PLOTLY_TEMPLATE["title_font_size"])
+    title_font_color = layout.pop("title_font_color", PLOTLY_TEMPLATE["title_font_color"])
     if isinstance(raw_title, dict):
         # Already a dict — ensure text key exists
         raw_title.setdefault("text", "")
@@ -31,7 +37,7 @@ def _apply_template(fig: go.Figure, **overrides) -> go.Figure:
             text=raw_title if raw_title else "",
             font=dict(size=title_font_size, color=title_font_color),
         )
-    fig.update_layout(**layout)
+    fig.update_layout(template="walker_brain", **layout)
     return fig
 
 
@@ -78,8 +84,8 @@ def trending_bar_chart(
     total = sum(values_sorted) or 1
     text_labels = [f"{v} ({v / total * 100:.0f}%)" for v in values_sorted]
 
-    colorway = PLOTLY_TEMPLATE["colorway"]
-    bar_colors = [colorway[i % len(colorway)] for i in range(len(labels_sorted))]
+    n = len(PLOTLY_COLORWAY)
+    bar_colors = [PLOTLY_COLORWAY[i % n] for i in range(len(labels_sorted))]
 
     bar = go.Bar(
         x=values_sorted,
@@ -215,8 +221,8 @@ def objection_bar(df: pd.DataFrame) -> go.Figure:
         )
     else:
         df_sorted["label"] = df_sorted["frequency"].astype(str)
-    colorway = PLOTLY_TEMPLATE["colorway"]
-    bar_colors = [colorway[i % len(colorway)] for i in range(len(df_sorted))]
+    n = len(PLOTLY_COLORWAY)
+    bar_colors = [PLOTLY_COLORWAY[i % n] for i in range(len(df_sorted))]
     fig = go.Figure(go.Bar(
         x=df_sorted["frequency"],
         y=df_sorted["obj_category"],
@@ -264,8 +270,12 @@ def quality_violin(df: pd.DataFrame, column: str = "quality_score") -> go.Figure
     """Violin plot of quality score distribution."""
     if df.empty or column not in df.columns:
         return _empty_chart("No quality data")
+    values = df[column].dropna()
     fig = go.Figure(go.Violin(
-        y=df[column].dropna(),
+        y=values,
+        # Drawing every outlier marker gets slow on large samples; the box
+        # and KDE already show the spread.
+        points=False if len(values) > 2000 else "outliers",
         box_visible=True,
         meanline_visible=True,
         fillcolor=_hex_to_rgba(COLORS["primary"], 0.08),
@@ -299,7 +309,8 @@ def scatter_calibration(
         showlegend=False,
     ))
 
-    fig.add_trace(go.Scatter(
+    # WebGL: calibration labels can run to thousands of points.
+    fig.add_trace(go.Scattergl(
         x=df[x_col],
         y=df[y_col],
         mode="markers",
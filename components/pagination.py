@@ -47,3 +47,21 @@ def paginated_controls(
 
     offset = page * page_size
     return offset, page
+
+
+def page_cursor(key: str, page: int) -> tuple | None:
+    """Keyset cursor for the start of page, if the page before it was loaded.
+
+    Cursors are kept per paginator in session_state[f"{key}_cursors"]; pop
+    that key when the filters change, alongside resetting the page.
+    """
+    return st.session_state.get(f"{key}_cursors", {}).get(page)
+
+
+def record_next_cursor(key: str, page: int, rows: list[dict], fields: tuple[str, ...]) -> None:
+    """Remember where page + 1 starts: the sort-key values of this page's last row."""
+    if not rows:
+        return
+    last = rows[-1]
+    if all(last.get(f) is not None for f in fields):
+        st.session_state.setdefault(f"{key}_cursors", {})[page + 1] = tuple(last[f] for f in fields)
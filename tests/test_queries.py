@@ -0,0 +1,29 @@
+"""Query-builder tests for utils.queries (no database needed)."""
+
+from postgrest import SyncPostgrestClient
+
+import utils.queries as queries
+
+
+def _builder():
+    client = SyncPostgrestClient("http://localhost:3000")
+    return client.from_("analysis_results").select("source_transcript_id", count="exact")
+
+
+def test_text_search_uses_websearch_fts_and_keeps_filters(monkeypatch):
+    monkeypatch.setattr(queries, "_has_search_tsv", lambda: True)
+    q = queries._text_search(_builder(), "car accident")
+    q = q.in_("case_type", ["MVA"]).limit(1)
+
+    params = q.request.params
+    assert params["search_tsv"] == "wfts(english).car accident"
+    assert params["case_type"] == "in.(MVA)"
+
+
+def test_short_term_falls_back_to_ilike(monkeypatch):
+    monkeypatch.setattr(queries, "_has_search_tsv", lambda: True)
+    q = queries._text_search(_builder(), "dw").in_("case_type", ["MVA"])
+
+    params = q.request.params
+    assert "search_tsv" not in params
+    assert params["or"].startswith("(summary.ilike.%dw%")
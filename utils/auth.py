@@ -5,7 +5,18 @@ from __future__ import annotations
 import streamlit as st
 
 from utils.theme import inject_theme, COLORS, TYPOGRAPHY, SPACING, SHADOWS, BORDERS
-from utils.db import authenticate_user, create_session, validate_session, delete_session, register_user
+from utils.db import (
+    authenticate_user, create_session, validate_session_cached, delete_session, register_user,
+)
+
+
+_LOGIN_CARD_HTML = f"""
+<div class="wb-login-card">
+    <div style="font-size: 2rem; margin-bottom: {SPACING["sm"]};">&#129504;</div>
+    <div class="wb-login-title">Walker Brain</div>
+    <div class="wb-login-subtitle">Sign in with your company email</div>
+</div>
+"""
 
 
 def check_password() -> bool:
@@ -23,7 +34,7 @@ def check_password() -> bool:
     # 2. Session token in URL — validate against DB
     session_token = st.query_params.get("_session")
     if session_token:
-        user = validate_session(session_token)
+        user = validate_session_cached(session_token)
         if user:
             st.session_state["authenticated"] = True
             st.session_state["user_email"] = user["user_email"]
@@ -38,33 +49,28 @@ def check_password() -> bool:
     # 3. Show login form
     inject_theme()
 
-    st.markdown(
-        f"""
-        <div class="wb-login-card">
-            <div style="font-size: 2rem; margin-bottom: {SPACING["sm"]};">&#129504;</div>
-            <div class="wb-login-title">Walker Brain</div>
-            <div class="wb-login-subtitle">Sign in with your company email</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_LOGIN_CARD_HTML, unsafe_allow_html=True)
 
     _, center, _ = st.columns([1, 1.2, 1])
     with center:
         sign_in_tab, create_tab = st.tabs(["Sign in", "Create account"])
 
         with sign_in_tab:
-            email = st.text_input(
-                "Email", key="login_email",
-                placeholder="you@walkeradvertising.com",
-                label_visibility="collapsed",
-            )
-            password = st.text_input(
-                "Password", type="password", key="login_password",
-                placeholder="Password",
-                label_visibility="collapsed",
-            )
-            if st.button("Sign in", type="primary", use_container_width=True):
+            # A form batches the inputs: editing a field does not rerun the
+            # app, only submitting does.
+            with st.form("login_form", border=False):
+                email = st.text_input(
+                    "Email", key="login_email",
+                    placeholder="you@walkeradvertising.com",
+                    label_visibility="collapsed",
+                )
+                password = st.text_input(
+                    "Password", type="password", key="login_password",
+                    placeholder="Password",
+                    label_visibility="collapsed",
+                )
+                signed_in = st.form_submit_button("Sign in", type="primary", use_container_width=True)
+            if signed_in:
                 if not email or not password:
                     st.error("Enter both email and password.")
                 else:
@@ -83,27 +89,29 @@ def check_password() -> bool:
                         st.error("Invalid email or password.")
 
         with create_tab:
-            reg_email = st.text_input(
-                "Email", key="reg_email",
-                placeholder="you@walkeradvertising.com",
-                label_visibility="collapsed",
-            )
-            reg_name = st.text_input(
-                "Display name", key="reg_name",
-                placeholder="Display name",
-                label_visibility="collapsed",
-            )
-            reg_password = st.text_input(
-                "Password", type="password", key="reg_password",
-                placeholder="Password",
-                label_visibility="collapsed",
-            )
-            reg_confirm = st.text_input(
-                "Confirm password", type="password", key="reg_confirm",
-                placeholder="Confirm password",
-                label_visibility="collapsed",
-            )
-            if st.button("Create account", type="primary", use_container_width=True):
+            with st.form("register_form", border=False):
+                reg_email = st.text_input(
+                    "Email", key="reg_email",
+                    placeholder="you@walkeradvertising.com",
+                    label_visibility="collapsed",
+                )
+                reg_name = st.text_input(
+                    "Display name", key="reg_name",
+                    placeholder="Display name",
+                    label_visibility="collapsed",
+                )
+                reg_password = st.text_input(
+                    "Password", type="password", key="reg_password",
+                    placeholder="Password",
+                    label_visibility="collapsed",
+                )
+                reg_confirm = st.text_input(
+                    "Confirm password", type="password", key="reg_confirm",
+                    placeholder="Confirm password",
+                    label_visibility="collapsed",
+                )
+                registered = st.form_submit_button("Create account", type="primary", use_container_width=True)
+            if registered:
                 if not reg_email or not reg_name or not reg_password or not reg_confirm:
                     st.error("All fields are required.")
                 elif reg_password != reg_confirm:
@@ -164,6 +172,7 @@ def logout() -> None:
             delete_session(token)
         except Exception:
             pass  # best-effort cleanup
+        validate_session_cached.clear()
 
     for key in ("authenticated", "user_email", "user_display_name", "user_is_admin", "session_token"):
         st.session_state.pop(key, None)
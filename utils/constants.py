@@ -1,6 +1,9 @@
 """Constants for Walker Brain Portal."""
 
-QUALITY_BANDS = {
+from types import MappingProxyType
+from typing import Final, Mapping
+
+QUALITY_BANDS: Final[dict[str, tuple[int, int, str]]] = {
     "POOR": (0, 29, "#E17055"),
     "NEEDS IMPROVEMENT": (30, 59, "#FDCB6E"),
     "ADEQUATE": (60, 74, "#F9CA24"),
@@ -8,7 +11,16 @@ QUALITY_BANDS = {
     "EXCEPTIONAL": (90, 100, "#D4A03C"),
 }
 
-CASE_TYPE_COLORS = {
+# (band_name, color) for every integer score 0-100, so quality_band is a
+# single list index instead of a scan over QUALITY_BANDS.
+_NO_BAND = ("N/A", "#6B7280")
+_BAND_LUT: list[tuple[str, str]] = [_NO_BAND] * 101
+for _name, (_lo, _hi, _color) in QUALITY_BANDS.items():
+    for _i in range(_lo, _hi + 1):
+        _BAND_LUT[_i] = (_name, _color)
+del _name, _lo, _hi, _color, _i
+
+CASE_TYPE_COLORS: Final[dict[str, str]] = {
     "auto-accident": "#D4A03C",
     "MVA": "#D4A03C",
     "slip-and-fall": "#E17055",
@@ -21,7 +33,7 @@ CASE_TYPE_COLORS = {
     "other": "#9CA3B4",
 }
 
-OBJECTION_CATEGORIES = [
+OBJECTION_CATEGORIES: Final[list[str]] = [
     "cost_anxiety",
     "risk_avoidance",
     "authority_doubt",
@@ -32,7 +44,7 @@ OBJECTION_CATEGORIES = [
     "process_confusion",
 ]
 
-TESTIMONIAL_STATUSES = [
+TESTIMONIAL_STATUSES: Final[list[str]] = [
     "flagged",
     "contacted",
     "scheduled",
@@ -41,7 +53,7 @@ TESTIMONIAL_STATUSES = [
     "declined",
 ]
 
-TESTIMONIAL_STATUS_COLORS = {
+TESTIMONIAL_STATUS_COLORS: Final[dict[str, str]] = {
     "flagged": "#6B7280",
     "contacted": "#74B9FF",
     "scheduled": "#FDCB6E",
@@ -50,86 +62,91 @@ TESTIMONIAL_STATUS_COLORS = {
     "declined": "#E17055",
 }
 
-TESTIMONIAL_TYPES = [
+TESTIMONIAL_TYPES: Final[list[str]] = [
     "not_suitable",
     "high_value_long_form",
     "quantity_short_form",
 ]
 
 # Centralized color maps (used by Angle Bank and other pages)
-CONTENT_TYPE_COLORS = {
+CONTENT_TYPE_COLORS: Final[dict[str, str]] = {
     "educational_explainer": "#74B9FF",
     "social_hook": "#6C5CE7",
     "case_study_brief": "#E17055",
     "testimonial_angle": "#00B894",
 }
 
-INTENT_COLORS = {
+INTENT_COLORS: Final[dict[str, str]] = {
     "Educate": "#74B9FF",
     "Empathize": "#6C5CE7",
     "Empower": "#00B894",
     "Activate": "#E17055",
 }
 
-FUNNEL_COLORS = {
+FUNNEL_COLORS: Final[dict[str, str]] = {
     "Problem Aware": "#E17055",
     "Solution Aware": "#FDCB6E",
     "Service Aware": "#00B894",
 }
 
 # Column groups for Call Data Explorer
-COLUMN_GROUPS = {
-    "Core": [
+COLUMN_GROUPS: Final[Mapping[str, tuple[str, ...]]] = MappingProxyType({
+    "Core": (
         "source_transcript_id", "case_type", "quality_score",
         "emotional_tone", "outcome", "analyzed_at",
-    ],
-    "Quality Sub-Scores": [
+    ),
+    "Quality Sub-Scores": (
         "quality_sub_scores",
-    ],
-    "Agent Scores": [
+    ),
+    "Agent Scores": (
         "agent_empathy_score", "agent_education_quality",
         "agent_objection_handling", "agent_closing_effectiveness",
-    ],
-    "Case Assessment": [
+    ),
+    "Case Assessment": (
         "liability_clarity", "injury_severity",
         "documentation_quality", "estimated_case_value_low",
         "estimated_case_value_high",
-    ],
-    "Objection Taxonomy": [
+    ),
+    "Objection Taxonomy": (
         "objection_categories", "mid_call_dropout_moment",
         "conversion_driver", "drop_off_reason",
         "agent_intervention_that_worked", "moment_that_closed",
-    ],
-    "Language & Culture": [
+    ),
+    "Language & Culture": (
         "reading_level_estimate", "communication_style",
         "spanglish_detected", "colloquialisms", "cultural_markers",
         "family_references", "verbatim_customer_language",
-    ],
-    "CX Intelligence": [
+    ),
+    "CX Intelligence": (
         "questions_repeated_by_attorney", "attorney_used_prior_info",
         "handoff_wait_time_mentioned", "attorney_sentiment",
         "attorney_rejection_reason", "testimonial_candidate",
         "testimonial_type", "review_request_eligible",
-    ],
-    "Content Mining": [
+    ),
+    "Content Mining": (
         "common_questions_asked", "misunderstandings",
         "education_calming_moment", "process_confusion_points",
         "other_brands_mentioned", "competitive_comparison",
         "category_confusion", "ad_or_creative_referenced",
         "ad_promise_vs_reality_mismatch", "repeated_questions_from_caller",
-    ],
-    "Emotional Arc": [
+    ),
+    "Emotional Arc": (
         "opening_emotional_state", "mid_call_emotional_shift",
         "end_state_emotion",
-    ],
-    "Metadata": [
+    ),
+    "Metadata": (
         "prompt_version_used", "confidence_score", "validation_passed",
         "api_cost", "input_tokens", "output_tokens", "analysis_type",
-    ],
-}
+    ),
+})
 
+# Reverse index: column -> its group (each column is listed in one group)
+COLUMN_TO_GROUP: Final[Mapping[str, str]] = MappingProxyType({
+    col: grp for grp, cols in COLUMN_GROUPS.items() for col in cols
+})
 
-TESTIMONIAL_TYPE_LABELS = {
+
+TESTIMONIAL_TYPE_LABELS: Final[dict[str, str]] = {
     "not_suitable": "Not Suitable",
     "high_value_long_form": "High Value \u2014 Long Form",
     "quantity_short_form": "Short Form",
@@ -137,28 +154,35 @@ TESTIMONIAL_TYPE_LABELS = {
 }
 
 
-TONE_BADGE_MAP: dict[str, str] = {
+TONE_BADGE_MAP: Final[dict[str, str]] = {
     # Red — distressed/negative
-    "distressed": "wb-badge-error",
-    "angry": "wb-badge-error",
-    "fearful": "wb-badge-error",
-    "frustrated": "wb-badge-error",
+    "distressed": "error",
+    "angry": "error",
+    "fearful": "error",
+    "frustrated": "error",
     # Amber — uncertain/mixed
-    "anxious": "wb-badge-warning",
-    "confused": "wb-badge-warning",
-    "skeptical": "wb-badge-warning",
+    "anxious": "warning",
+    "confused": "warning",
+    "skeptical": "warning",
     # Green — positive
-    "hopeful": "wb-badge-success",
-    "grateful": "wb-badge-success",
-    "relieved": "wb-badge-success",
+    "hopeful": "success",
+    "grateful": "success",
+    "relieved": "success",
     # Blue — neutral
-    "neutral": "wb-badge-info",
-    "calm": "wb-badge-info",
-    "neutral_calm": "wb-badge-info",
+    "neutral": "info",
+    "calm": "info",
+    "neutral_calm": "info",
 }
 
+# Lookup keyed by lowercased/stripped tone so DB enum values hit directly
+_TONE_BADGE_MAP_NORM: dict[str, str] = {k.lower().strip(): v for k, v in TONE_BADGE_MAP.items()}
+
 # Falsy sentinel values to filter out of list displays
-_FALSY_SENTINELS = {False, None, "", "none", "null", "n/a", "false", "None", "N/A"}
+# (no False entry: bools are numbers, and numbers are never sentinels)
+_FALSY_SENTINELS = frozenset({None, "", "none", "null", "n/a", "false", "None", "N/A"})
+
+# Characters clean_language trims from both ends of a language value
+_QUOTE_WS = "' \t\n\r"
 
 
 def humanize(snake_str: str) -> str:
@@ -166,6 +190,13 @@ def humanize(snake_str: str) -> str:
     return snake_str.replace("_", " ").title()
 
 
+def _fmt_money(v: float | int | str) -> str:
+    """'$200k' at or above $1,000, else '$950'."""
+    if type(v) is not int and type(v) is not float:
+        v = float(v)
+    return f"${v / 1000:.0f}k" if v >= 1000 else f"${v:,.0f}"
+
+
 def format_case_value(
     low: float | int | None,
     high: float | int | None,
@@ -174,29 +205,23 @@ def format_case_value(
     """Format estimated case value range as '$200k – $500k (High)'. Returns '—' if both None."""
     if low is None and high is None:
         return "\u2014"
-    parts = []
     try:
-        if low is not None:
-            v = float(low)
-            parts.append(f"${v / 1000:.0f}k" if v >= 1000 else f"${v:,.0f}")
-        else:
-            parts.append("?")
-        if high is not None:
-            v = float(high)
-            parts.append(f"${v / 1000:.0f}k" if v >= 1000 else f"${v:,.0f}")
+        lo = _fmt_money(low) if low is not None else "?"
+        hi = _fmt_money(high) if high is not None else None
     except (TypeError, ValueError):
         return "\u2014"
-    result = " \u2013 ".join(parts)
-    if category:
-        result += f" ({category})"
-    return result
+    result = lo if hi is None else f"{lo} \u2013 {hi}"
+    return f"{result} ({category})" if category else result
 
 
-def get_badge_class(tone: str | None) -> str:
-    """Return the CSS class for an emotional tone badge pill."""
+def get_badge_variant(tone: str | None) -> str:
+    """Return the badge variant (``data-variant``) for an emotional tone pill."""
     if not tone:
-        return "wb-badge-info"
-    return TONE_BADGE_MAP.get(tone.lower().strip(), "wb-badge-info")
+        return "info"
+    badge = _TONE_BADGE_MAP_NORM.get(tone)
+    if badge is not None:
+        return badge
+    return _TONE_BADGE_MAP_NORM.get(tone.lower().strip(), "info")
 
 
 def is_falsy_sentinel(value) -> bool:
@@ -204,31 +229,29 @@ def is_falsy_sentinel(value) -> bool:
 
     Note: numeric 0 is NOT a sentinel — it's a valid score/value.
     """
-    if isinstance(value, (int, float)):
-        return False
-    if value in _FALSY_SENTINELS:
+    if value is None:
         return True
-    if isinstance(value, str) and value.strip().lower() in _FALSY_SENTINELS:
-        return True
-    return False
+    if type(value) is str:
+        return value in _FALSY_SENTINELS or value.strip().lower() in _FALSY_SENTINELS
+    # Numbers, lists, dicts, str subclasses
+    return isinstance(value, str) and value.strip().lower() in _FALSY_SENTINELS
 
 
 def clean_language(val: str | None) -> str:
     """Strip wrapping single-quotes and whitespace from language values."""
     if not val:
         return ""
-    return val.strip("'").strip()
+    return val.strip(_QUOTE_WS)
 
 
 def quality_band(score: int | float | str | None) -> tuple[str, str]:
     """Return (band_name, color) for a quality score."""
     if score is None:
-        return ("N/A", "#6B7280")
+        return _NO_BAND
     try:
-        score = float(score)
-    except (TypeError, ValueError):
-        return ("N/A", "#6B7280")
-    for band_name, (low, high, color) in QUALITY_BANDS.items():
-        if low <= score <= high:
-            return (band_name, color)
-    return ("N/A", "#6B7280")
+        s = int(float(score))
+    except (TypeError, ValueError, OverflowError):
+        return _NO_BAND
+    if s < 0 or s > 100:
+        return _NO_BAND
+    return _BAND_LUT[s]
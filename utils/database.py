@@ -1,5 +1,6 @@
 """Database connection and query utilities for Walker Brain Portal."""
 
+import httpx
 import streamlit as st
 from supabase import create_client, Client
 import pandas as pd
@@ -7,14 +8,79 @@ import pandas as pd
 
 @st.cache_resource
 def get_supabase() -> Client:
-    """Singleton Supabase client for the Analysis DB."""
+    """Singleton Supabase client for the Analysis DB.
+
+    Cached with st.cache_resource so every page, session and worker thread
+    shares one client — and with it one httpx connection pool, keeping TLS
+    connections alive across queries instead of re-handshaking per page.
+    """
     return create_client(
         st.secrets["database"]["url"],
         st.secrets["database"]["key"],
     )
 
 
-@st.cache_data(ttl=300)
+def _execute(q):
+    """Execute a read query, retrying once if a pooled connection went stale.
+
+    The shared client keeps connections alive between reruns; when the server
+    has already closed an idle one, the first request on it fails with
+    RemoteProtocolError and the retry goes out on a fresh connection.
+    """
+    try:
+        return q.execute()
+    except httpx.RemoteProtocolError:
+        return q.execute()
+
+
+def _canonical(v):
+    """Type-tagged, order-independent form of v for cache keys.
+
+    Dict items are sorted; every other value keeps its type name, so
+    ("a",) vs ["a"] or 1 vs "1" stay distinct keys.
+    """
+    if isinstance(v, dict):
+        items = ((_canonical(k), _canonical(x)) for k, x in v.items())
+        return ("dict", tuple(sorted(items, key=repr)))
+    if isinstance(v, (list, tuple, set, frozenset)):
+        seq = (_canonical(x) for x in v)
+        if isinstance(v, (set, frozenset)):
+            seq = sorted(seq, key=repr)
+        return (type(v).__name__, tuple(seq))
+    return (type(v).__qualname__, repr(v))
+
+
+def _canonical_key(d: dict) -> str:
+    """Cache-key hash for dict args: key order doesn't create a new entry."""
+    return repr(_canonical(d))
+
+
+# Cached query helpers are capped at 128 entries each (LRU-evicted before the
+# TTL) so many distinct filter combinations can't grow memory unbounded.
+_QUERY_CACHE = dict(
+    ttl=300,
+    max_entries=128,
+    show_spinner=False,
+    hash_funcs={dict: _canonical_key},
+)
+
+
+# query_table filter operator -> PostgREST builder method ("not.is" is
+# handled separately since it goes through the .not_ modifier).
+_FILTER_OPS = {
+    "gte": "gte",
+    "lte": "lte",
+    "gt": "gt",
+    "lt": "lt",
+    "neq": "neq",
+    "like": "like",
+    "ilike": "ilike",
+    "in": "in_",
+    "is": "is_",
+}
+
+
+@st.cache_data(**_QUERY_CACHE)
 def query_table(
     table: str,
     select: str = "*",
@@ -27,7 +93,10 @@ def query_table(
 
     Args:
         table: Table or view name.
-        select: Comma-separated column list.
+        select: Comma-separated column list. May embed FK-related tables
+                to fetch them in the same request, e.g.
+                "*, transcripts(source_transcript_id, case_type)"; the
+                related rows come back nested under that key.
         filters: Dict of {column: value} for .eq() filters,
                  or {column: ("operator", value)} for other operators.
         order: Column to order by, prefix with '-' for DESC.
@@ -41,26 +110,12 @@ def query_table(
         for col, val in filters.items():
             if isinstance(val, tuple):
                 op, v = val
-                if op == "gte":
-                    q = q.gte(col, v)
-                elif op == "lte":
-                    q = q.lte(col, v)
-                elif op == "gt":
-                    q = q.gt(col, v)
-                elif op == "lt":
-                    q = q.lt(col, v)
-                elif op == "neq":
-                    q = q.neq(col, v)
-                elif op == "like":
-                    q = q.like(col, v)
-                elif op == "ilike":
-                    q = q.ilike(col, v)
-                elif op == "in":
-                    q = q.in_(col, v)
-                elif op == "not.is":
+                if op == "not.is":
                     q = q.not_.is_(col, v)
-                elif op == "is":
-                    q = q.is_(col, v)
+                else:
+                    meth = _FILTER_OPS.get(op)
+                    if meth is not None:
+                        q = getattr(q, meth)(col, v)
             else:
                 q = q.eq(col, val)
 
@@ -70,19 +125,45 @@ def query_table(
         else:
             q = q.order(order)
 
-    if offset is not None:
-        q = q.range(offset, offset + (limit or 50) - 1)
-    elif limit is not None:
-        q = q.limit(limit)
+    # Any explicit window goes out as a Range, so the server returns exactly
+    # the rows asked for; with neither set, PostgREST's max-rows cap applies.
+    if offset is not None or limit is not None:
+        lo = offset or 0
+        n = limit if limit is not None else 50
+        # An empty Range (hi < lo) is rejected server-side; limit=0 means no rows.
+        q = q.range(lo, lo + n - 1) if n > 0 else q.limit(0)
 
-    return q.execute().data
+    return _execute(q).data
 
 
-@st.cache_data(ttl=300)
+def iter_table(
+    table: str,
+    select: str = "*",
+    filters: dict | None = None,
+    order: str | None = None,
+    page_size: int = 1000,
+):
+    """Yield every matching row, fetching page_size rows per request.
+
+    Pass an order for stable pages. Each page goes through query_table, so it
+    is cached like any other query.
+    """
+    lo = 0
+    while True:
+        rows = query_table(table, select, filters, order, limit=page_size, offset=lo)
+        if not rows:
+            return
+        yield from rows
+        if len(rows) < page_size:
+            return
+        lo += page_size
+
+
+@st.cache_data(**_QUERY_CACHE)
 def run_rpc(function_name: str, params: dict | None = None) -> list[dict]:
     """Call a Supabase RPC function."""
     client = get_supabase()
-    return client.rpc(function_name, params or {}).execute().data
+    return _execute(client.rpc(function_name, params or {})).data
 
 
 def query_df(
@@ -93,9 +174,15 @@ def query_df(
     limit: int | None = None,
     offset: int | None = None,
 ) -> pd.DataFrame:
-    """Query a table and return as DataFrame."""
+    """Query a table and return as DataFrame.
+
+    PostgREST returns every row with the same keys, so the columns are taken
+    from the first row instead of letting pandas union the keys of all rows.
+    """
     rows = query_table(table, select, filters, order, limit, offset)
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows, columns=list(rows[0]))
 
 
 def upsert_row(table: str, data: dict, on_conflict: str | None = None) -> dict:
@@ -117,7 +204,7 @@ def update_row(table: str, data: dict, match: dict) -> dict:
     return q.execute().data
 
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
 def get_distinct_values(table: str, column: str) -> list[str]:
     """Get distinct non-null values for a column via SQL RPC. Cached 1 hour.
 
@@ -125,7 +212,7 @@ def get_distinct_values(table: str, column: str) -> list[str]:
     that would silently truncate filter dropdown options.
     """
     client = get_supabase()
-    rows = client.rpc(
+    rows = _execute(client.rpc(
         "get_distinct_column_values", {"p_table": table, "p_column": column}
-    ).execute().data
+    )).data
     return [row["value"] for row in rows if row.get("value")]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import streamlit as st
+
 from utils.database import get_supabase
 
 
@@ -39,6 +41,16 @@ def validate_session(token: str) -> dict[str, Any] | None:
     return rows[0] if rows else None
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def validate_session_cached(token: str) -> dict[str, Any] | None:
+    """validate_session with a short TTL so reruns don't each hit the DB.
+
+    Kept short so revoked sessions stop working within 30 seconds; logout()
+    clears it immediately.
+    """
+    return validate_session(token)
+
+
 def register_user(email: str, password: str, display_name: str | None = None) -> dict[str, Any] | None:
     """Self-register a new user (domain-checked in RPC)."""
     client = get_supabase()
@@ -7,13 +7,11 @@ import streamlit as st
 
 def download_csv(df: pd.DataFrame, filename: str = "export.csv") -> None:
     """Render a right-aligned CSV download button for the given DataFrame."""
-    csv_buf = io.StringIO()
-    df.to_csv(csv_buf, index=False)
     _, btn_col = st.columns([3, 1])
     with btn_col:
         st.download_button(
             label="Export CSV",
-            data=csv_buf.getvalue(),
+            data=df.to_csv(index=False).encode("utf-8"),
             file_name=filename,
             mime="text/csv",
             type="primary",
@@ -43,6 +41,16 @@ def format_quote_for_clipboard(
     return "\n".join(parts)
 
 
+@st.cache_resource
+def _docx_template_bytes() -> bytes:
+    """python-docx's default template, read and unpacked once per process."""
+    from docx import Document
+
+    buf = io.BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
 def generate_word_doc(title: str, content_blocks: list[dict]) -> bytes:
     """Generate a Word document from content blocks.
 
@@ -50,7 +58,7 @@ def generate_word_doc(title: str, content_blocks: list[dict]) -> bytes:
     """
     from docx import Document
 
-    doc = Document()
+    doc = Document(io.BytesIO(_docx_template_bytes()))
     doc.add_heading(title, level=0)
 
     for block in content_blocks:
@@ -3,15 +3,39 @@
 Uses PostgREST via supabase-py for all queries.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
 import streamlit as st
 import pandas as pd
+from postgrest.exceptions import APIError
 from utils.database import query_table, query_df, get_distinct_values, get_supabase
+from utils.constants import COLUMN_TO_GROUP, clean_language
 
 
 # ---------------------------------------------------------------------------
 # Filter helpers
 # ---------------------------------------------------------------------------
 
+def _now_utc() -> datetime:
+    """Timezone-aware current time."""
+    return datetime.now(timezone.utc)
+
+
+def _ts(dt: datetime) -> str:
+    """Strict UTC timestamp literal for PostgREST filters, e.g. 2025-06-01T12:00:00Z.
+
+    Whole seconds with an explicit Z: Postgres casts the constant once to
+    timestamptz and compares it against the analyzed_at index directly.
+    """
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def utc_cutoff(days: float) -> str:
+    """Timestamp literal for 'days ago', for gte() filters on timestamptz columns."""
+    return _ts(_now_utc() - timedelta(days=days))
+
+
 @st.cache_data(ttl=3600)
 def get_case_types() -> list[str]:
     return get_distinct_values("analysis_results", "case_type")
@@ -29,16 +53,37 @@ def get_outcomes() -> list[str]:
 
 @st.cache_data(ttl=3600)
 def get_languages() -> list[str]:
-    from utils.constants import clean_language
     raw = get_distinct_values("analysis_results", "original_language")
-    seen = set()
-    cleaned = []
-    for v in raw:
-        c = clean_language(v)
-        if c and c not in seen:
-            seen.add(c)
-            cleaned.append(c)
-    return cleaned
+    return [c for c in dict.fromkeys(map(clean_language, raw)) if c]
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+# Sort keys (all DESC) of the paginated lists. A cursor is the tuple of these
+# values from the last row of the previous page; the next page is fetched as
+# "rows after the cursor" so Postgres seeks instead of scanning past OFFSET.
+CALLS_CURSOR_KEYS = ("analyzed_at", "source_transcript_id")
+QUOTES_CURSOR_KEYS = ("quality_score", "analyzed_at", "source_transcript_id")
+
+
+def _seek_terms(keys: tuple, values: tuple) -> str:
+    """PostgREST or-terms for the row-value comparison (keys) < (values)."""
+    col = keys[0]
+    val = '"' + str(values[0]).replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if len(keys) == 1:
+        return f"{col}.lt.{val}"
+    return f"{col}.lt.{val},and({col}.eq.{val},or({_seek_terms(keys[1:], values[1:])}))"
+
+
+def _page(q, keys: tuple, cursor: tuple | None, limit: int, offset: int):
+    """Apply the page window: seek past cursor when known, else OFFSET."""
+    if cursor is not None:
+        return q.or_(_seek_terms(keys, cursor)).limit(limit)
+    if offset > 0:
+        return q.range(offset, offset + limit - 1)
+    return q.limit(limit)
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +96,14 @@ QUOTE_COLUMNS = (
     "testimonial_candidate, testimonial_type, verbatim_customer_language"
 )
 
+# What quote_card renders: QUOTE_COLUMNS minus the long verbatim text, for
+# read-only teasers like the dashboard's top quotes.
+QUOTE_TEASER_COLUMNS = (
+    "source_transcript_id, key_quote, case_type, emotional_tone, "
+    "quality_score, original_language, suggested_tags, analyzed_at, "
+    "testimonial_candidate, testimonial_type"
+)
+
 
 def fetch_quotes(
     min_quality: int = 0,
@@ -63,23 +116,27 @@ def fetch_quotes(
     end_date: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: tuple | None = None,
+    columns: str = QUOTE_COLUMNS,
 ) -> list[dict]:
-    """Fetch quotes from analysis_results with filters."""
+    """Fetch quotes from analysis_results with filters.
+
+    Pass cursor (QUOTES_CURSOR_KEYS of the previous page's last row) to seek
+    to the next page; offset is only used when no cursor is known.
+    """
     client = get_supabase()
     q = (
         client.table("analysis_results")
-        .select(QUOTE_COLUMNS)
+        .select(columns)
         .not_.is_("key_quote", "null")
         .neq("key_quote", "")
         .gte("quality_score", min_quality)
         .lte("quality_score", max_quality)
         .order("quality_score", desc=True)
         .order("analyzed_at", desc=True)
+        .order("source_transcript_id", desc=True)
     )
-    if offset > 0:
-        q = q.range(offset, offset + limit - 1)
-    else:
-        q = q.limit(limit)
+    q = _page(q, QUOTES_CURSOR_KEYS, cursor, limit, offset)
     if case_types:
         q = q.in_("case_type", case_types)
     if tones:
@@ -127,6 +184,67 @@ DETAIL_COLUMNS = (
     "has_attorney_leg, analysis_type, estimated_case_value_category"
 )
 
+# ilike wildcards and PostgREST or-syntax delimiters, backslash-escaped
+_ILIKE_ESCAPES = str.maketrans({
+    c: "\\" + c for c in ("\\", "%", "_", "(", ")", ".", ",")
+})
+
+
+def _escape_ilike(text: str) -> str:
+    """Escape user text for an ilike pattern inside an or_() filter."""
+    return text.translate(_ILIKE_ESCAPES)
+
+
+
+# PostgREST / Postgres codes for "no such column"
+_MISSING_COLUMN_CODES = frozenset({"PGRST204", "42703"})
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _probe_search_tsv() -> bool:
+    """Whether analysis_results has the generated search_tsv (GIN) column.
+
+    Only a missing-column error is a cached False; anything else (timeout,
+    dropped connection) raises, and st.cache_data doesn't cache exceptions.
+    """
+    try:
+        get_supabase().table("analysis_results").select("search_tsv").limit(0).execute()
+        return True
+    except APIError as e:
+        if e.code in _MISSING_COLUMN_CODES:
+            return False
+        raise
+
+
+def _has_search_tsv() -> bool:
+    """_probe_search_tsv(), treating a transient failure as False for this call only."""
+    try:
+        return _probe_search_tsv()
+    except Exception:
+        return False
+
+
+def _text_search(q, text: str):
+    """Match text against summary / key_quote / primary_topic.
+
+    Uses the search_tsv full-text index (websearch_to_tsquery, via wfts)
+    when the column exists; short terms and older schemas fall back to
+    substring ilike, which cannot use an index. Both keep q a filter
+    builder, so further filters can be chained.
+    """
+    if len(text.strip()) >= 3 and _has_search_tsv():
+        return q.filter("search_tsv", "wfts(english)", text)
+    safe = _escape_ilike(text)
+    return q.or_(
+        f"summary.ilike.%{safe}%,"
+        f"key_quote.ilike.%{safe}%,"
+        f"primary_topic.ilike.%{safe}%"
+    )
+
+
+# Full single-call projection, built once
+CALL_DETAIL_COLUMNS = f"{SEARCH_COLUMNS}, {DETAIL_COLUMNS}"
+
 
 def search_calls(
     text_search: str | None = None,
@@ -141,8 +259,9 @@ def search_calls(
     content_worthy: bool = False,
     limit: int = 50,
     offset: int = 0,
+    cursor: tuple | None = None,
 ) -> list[dict]:
-    """Search calls with full filter set."""
+    """Search calls with full filter set. cursor: see CALLS_CURSOR_KEYS."""
     client = get_supabase()
     q = (
         client.table("analysis_results")
@@ -150,20 +269,11 @@ def search_calls(
         .gte("quality_score", min_quality)
         .lte("quality_score", max_quality)
         .order("analyzed_at", desc=True)
+        .order("source_transcript_id", desc=True)
     )
-    if offset > 0:
-        q = q.range(offset, offset + limit - 1)
-    else:
-        q = q.limit(limit)
+    q = _page(q, CALLS_CURSOR_KEYS, cursor, limit, offset)
     if text_search:
-        safe = (text_search.replace("\\", "\\\\").replace("%", "\\%")
-                .replace("_", "\\_").replace("(", "\\(").replace(")", "\\)")
-                .replace(".", "\\.").replace(",", "\\,"))
-        q = q.or_(
-            f"summary.ilike.%{safe}%,"
-            f"key_quote.ilike.%{safe}%,"
-            f"primary_topic.ilike.%{safe}%"
-        )
+        q = _text_search(q, text_search)
     if case_types:
         q = q.in_("case_type", case_types)
     if tones:
@@ -181,12 +291,13 @@ def search_calls(
     return q.execute().data
 
 
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
 def get_call_detail(source_transcript_id: str) -> dict | None:
-    """Fetch full detail for a single call."""
+    """Fetch full detail for a single call. Cached: analyses don't change."""
     client = get_supabase()
     rows = (
         client.table("analysis_results")
-        .select(f"{SEARCH_COLUMNS}, {DETAIL_COLUMNS}")
+        .select(CALL_DETAIL_COLUMNS)
         .eq("source_transcript_id", source_transcript_id)
         .limit(1)
         .execute()
@@ -195,8 +306,9 @@ def get_call_detail(source_transcript_id: str) -> dict | None:
     return rows[0] if rows else None
 
 
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
 def get_transcript(source_transcript_id: str) -> str | None:
-    """Lazy-load transcript for a single call."""
+    """Lazy-load transcript for a single call. Few entries: transcripts are large."""
     client = get_supabase()
     rows = (
         client.table("analysis_results")
@@ -225,21 +337,28 @@ def fetch_explorer_data(
     languages: list[str] | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: tuple | None = None,
 ) -> pd.DataFrame:
-    """Fetch data for Call Data Explorer with selected column groups."""
+    """Fetch data for Call Data Explorer with selected column groups.
+
+    cursor: see CALLS_CURSOR_KEYS (only recoverable when Core is selected).
+    """
     client = get_supabase()
-    select_str = ", ".join(columns)
+    # Project only known explorer columns, each once, with the key always
+    # first (the row detail picker and keyset cursor both need it).
+    cols = [c for c in dict.fromkeys(columns) if c in COLUMN_TO_GROUP]
+    if "source_transcript_id" not in cols:
+        cols.insert(0, "source_transcript_id")
+    select_str = ", ".join(cols)
     q = (
         client.table("analysis_results")
         .select(select_str)
         .gte("quality_score", min_quality)
         .lte("quality_score", max_quality)
         .order("analyzed_at", desc=True)
+        .order("source_transcript_id", desc=True)
     )
-    if offset > 0:
-        q = q.range(offset, offset + limit - 1)
-    else:
-        q = q.limit(limit)
+    q = _page(q, CALLS_CURSOR_KEYS, cursor, limit, offset)
     if case_types:
         q = q.in_("case_type", case_types)
     if languages:
@@ -250,109 +369,77 @@ def fetch_explorer_data(
         q = q.lte("analyzed_at", end_date)
 
     rows = q.execute().data
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
+    return pd.DataFrame(rows, columns=cols) if rows else pd.DataFrame()
 
 
 # ---------------------------------------------------------------------------
 # Dashboard / Today's Highlights
 # ---------------------------------------------------------------------------
 
-def get_weekly_metric_counts(days: int = 7) -> dict:
-    """Get aggregated counts for dashboard metric cards."""
+def _period_metrics(start: str, end: str | None = None) -> dict:
+    """Dashboard metric card values for analyses in [start, end)."""
     client = get_supabase()
-    from datetime import datetime, timedelta
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-    quotes = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .not_.is_("key_quote", "null")
-        .neq("key_quote", "")
-        .gte("analyzed_at", cutoff)
-        .execute()
-    )
-    testimonials = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .eq("testimonial_candidate", True)
-        .gte("analyzed_at", cutoff)
-        .execute()
-    )
-    content = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .eq("content_generation_flag", True)
-        .gte("analyzed_at", cutoff)
-        .execute()
-    )
-    median_rows = client.rpc(
-        "get_quality_median", {"cutoff_start": cutoff}
-    ).execute().data
-    median_val = median_rows[0].get("median") if median_rows else None
-    median = int(round(median_val)) if median_val is not None else 0
+    params = {"cutoff_start": start}
+    if end:
+        params["cutoff_end"] = end
 
+    def _count(where) -> int:
+        q = where(
+            client.table("analysis_results")
+            .select("source_transcript_id", count="exact")
+            .gte("analyzed_at", start)
+        )
+        if end:
+            q = q.lt("analyzed_at", end)
+        return q.limit(1).execute().count or 0
+
+    def _median() -> int:
+        rows = client.rpc("get_quality_median", params).execute().data
+        val = rows[0].get("median") if rows else None
+        return int(round(val)) if val is not None else 0
+
+    # Independent I/O-bound round trips: run them concurrently so the panel
+    # waits for the slowest one rather than the sum.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        quotes = pool.submit(_count, lambda q: q.not_.is_("key_quote", "null").neq("key_quote", ""))
+        testimonials = pool.submit(_count, lambda q: q.eq("testimonial_candidate", True))
+        content = pool.submit(_count, lambda q: q.eq("content_generation_flag", True))
+        median = pool.submit(_median)
     return {
-        "quotes": quotes.count or 0,
-        "testimonials": testimonials.count or 0,
-        "content_worthy": content.count or 0,
-        "median_quality": median,
+        "quotes": quotes.result(),
+        "testimonials": testimonials.result(),
+        "content_worthy": content.result(),
+        "median_quality": median.result(),
     }
 
 
-def get_prior_period_metrics(days: int = 7) -> dict:
-    """Get metric counts for the period immediately BEFORE the current window."""
-    client = get_supabase()
-    from datetime import datetime, timedelta
-    now = datetime.utcnow()
-    cutoff_current = (now - timedelta(days=days)).isoformat()
-    cutoff_prior = (now - timedelta(days=days * 2)).isoformat()
+@st.cache_data(ttl=300, show_spinner=False)
+def get_weekly_metric_counts(days: int = 7) -> dict:
+    """Get aggregated counts for dashboard metric cards."""
+    cutoff = utc_cutoff(days)
+    return _period_metrics(cutoff)
 
-    quotes = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .not_.is_("key_quote", "null")
-        .gte("analyzed_at", cutoff_prior)
-        .lt("analyzed_at", cutoff_current)
-        .execute()
-    )
-    testimonials = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .eq("testimonial_candidate", True)
-        .gte("analyzed_at", cutoff_prior)
-        .lt("analyzed_at", cutoff_current)
-        .execute()
-    )
-    content = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .eq("content_generation_flag", True)
-        .gte("analyzed_at", cutoff_prior)
-        .lt("analyzed_at", cutoff_current)
-        .execute()
-    )
-    median_rows = client.rpc(
-        "get_quality_median",
-        {"cutoff_start": cutoff_prior, "cutoff_end": cutoff_current},
-    ).execute().data
-    median_val = median_rows[0].get("median") if median_rows else None
-    median = int(round(median_val)) if median_val is not None else 0
 
-    return {
-        "quotes": quotes.count or 0,
-        "testimonials": testimonials.count or 0,
-        "content_worthy": content.count or 0,
-        "median_quality": median,
-    }
+@st.cache_data(ttl=300, show_spinner=False)
+def get_prior_period_metrics(days: int = 7) -> dict:
+    """Get metric counts for the period immediately BEFORE the current window."""
+    now = _now_utc()
+    cutoff_current = _ts(now - timedelta(days=days))
+    cutoff_prior = _ts(now - timedelta(days=days * 2))
+    return _period_metrics(cutoff_prior, cutoff_current)
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def get_top_quotes(days: int = 7, limit: int = 5) -> list[dict]:
-    """Top N quotes by quality in the last N days."""
-    from datetime import datetime, timedelta
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-    return fetch_quotes(min_quality=0, max_quality=100, limit=limit, start_date=cutoff)
+    """Top N quotes by quality in the last N days (teaser columns only)."""
+    cutoff = utc_cutoff(days)
+    return fetch_quotes(
+        min_quality=0, max_quality=100, limit=limit, start_date=cutoff,
+        columns=QUOTE_TEASER_COLUMNS,
+    )
 
 
+@st.cache_data(ttl=600, show_spinner=False)
 def get_daily_volume(days: int = 7) -> pd.DataFrame:
     """Daily call volume for the trend chart.
 
@@ -399,11 +486,10 @@ def update_testimonial_status(
 ) -> dict:
     """Update a testimonial's status."""
     from utils.database import update_row
-    from datetime import datetime
 
     data = {
         "status": new_status,
-        "status_updated_at": datetime.utcnow().isoformat(),
+        "status_updated_at": _now_utc().isoformat(),
         "status_updated_by": updated_by,
     }
     if notes is not None:
@@ -427,8 +513,7 @@ def get_system_status() -> dict | None:
 
 def get_cost_tracking(days: int = 30) -> pd.DataFrame:
     """Fetch cost tracking data."""
-    from datetime import datetime, timedelta
-    cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+    cutoff = (_now_utc() - timedelta(days=days)).strftime("%Y-%m-%d")
     return query_df(
         "cost_tracking",
         order="-date",
@@ -436,6 +521,31 @@ def get_cost_tracking(days: int = 30) -> pd.DataFrame:
     )
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def get_recent_throughput(days: int = 7) -> dict:
+    """Processed count, validation passes and mean quality over the last N days.
+
+    Shared by the System Health summary and its admin throughput section so
+    both read one cached query instead of issuing near-identical ones.
+    """
+    client = get_supabase()
+    cutoff = utc_cutoff(days)
+    res = (
+        client.table("analysis_results")
+        .select("quality_score, validation_passed", count="exact")
+        .gte("analyzed_at", cutoff)
+        .limit(10000)
+        .execute()
+    )
+    data = res.data or []
+    scores = [r["quality_score"] for r in data if r.get("quality_score") is not None]
+    return {
+        "total": res.count or 0,
+        "passed": sum(1 for r in data if r.get("validation_passed") is True),
+        "avg_quality": sum(scores) / len(scores) if scores else 0,
+    }
+
+
 def get_drift_alerts(limit: int = 10) -> list[dict]:
     """Fetch recent drift alerts."""
     return query_table("drift_alerts", order="-created_at", limit=limit)
@@ -450,7 +560,7 @@ def get_prompt_library() -> list[dict]:
 # Freshness + pipeline stats (for app.py billboard and page headers)
 # ---------------------------------------------------------------------------
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_last_updated() -> str | None:
     """Return the most recent analyzed_at timestamp as a human-readable string."""
     client = get_supabase()
@@ -463,7 +573,6 @@ def get_last_updated() -> str | None:
         .data
     )
     if rows and rows[0].get("analyzed_at"):
-        from datetime import datetime, timezone
         ts = rows[0]["analyzed_at"]
         try:
             dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
@@ -477,41 +586,56 @@ def get_last_updated() -> str | None:
 
 @st.cache_data(ttl=600)
 def get_pipeline_stats() -> dict:
-    """Get aggregate stats for the app.py orientation billboard."""
+    """Get aggregate stats for the app.py orientation billboard.
+
+    The three lookups are independent, so they run concurrently.
+    """
     client = get_supabase()
-    count_res = (
-        client.table("analysis_results")
-        .select("source_transcript_id", count="exact")
-        .execute()
-    )
-    total = count_res.count or 0
 
-    min_res = (
-        client.table("analysis_results")
-        .select("analyzed_at")
-        .order("analyzed_at")
-        .limit(1)
-        .execute()
-        .data
-    )
-    since = min_res[0]["analyzed_at"][:10] if min_res else None
+    def _total() -> int:
+        return (
+            client.table("analysis_results")
+            .select("source_transcript_id", count="exact")
+            .limit(1)
+            .execute()
+            .count
+        ) or 0
+
+    def _since() -> str | None:
+        rows = (
+            client.table("analysis_results")
+            .select("analyzed_at")
+            .order("analyzed_at")
+            .limit(1)
+            .execute()
+            .data
+        )
+        return rows[0]["analyzed_at"][:10] if rows else None
 
-    status_res = (
-        client.table("system_status")
-        .select("system_active")
-        .limit(1)
-        .execute()
-        .data
-    )
-    is_active = status_res[0].get("system_active", False) if status_res else False
+    def _active() -> bool:
+        rows = (
+            client.table("system_status")
+            .select("system_active")
+            .limit(1)
+            .execute()
+            .data
+        )
+        return rows[0].get("system_active", False) if rows else False
 
-    return {"total": total, "since": since, "active": is_active}
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        total, since, is_active = pool.submit(_total), pool.submit(_since), pool.submit(_active)
+    return {"total": total.result(), "since": since.result(), "active": is_active.result()}
 
 
 # ---------------------------------------------------------------------------
 # Count helpers (for pagination)
 # ---------------------------------------------------------------------------
+# An exact count scans every matching row, so counts are cached per filter
+# set for a minute: paging through results (or any other rerun) reuses the
+# total instead of recounting. limit(1) keeps the response to one row — the
+# total still comes back in Content-Range.
 
+@st.cache_data(ttl=60, show_spinner=False)
 def count_quotes(
     min_quality: int = 0,
     max_quality: int = 100,
@@ -544,9 +668,10 @@ def count_quotes(
         q = q.gte("analyzed_at", start_date)
     if end_date:
         q = q.lte("analyzed_at", end_date)
-    return q.execute().count or 0
+    return q.limit(1).execute().count or 0
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def count_calls(
     text_search: str | None = None,
     case_types: list[str] | None = None,
@@ -568,14 +693,7 @@ def count_calls(
         .lte("quality_score", max_quality)
     )
     if text_search:
-        safe = (text_search.replace("\\", "\\\\").replace("%", "\\%")
-                .replace("_", "\\_").replace("(", "\\(").replace(")", "\\)")
-                .replace(".", "\\.").replace(",", "\\,"))
-        q = q.or_(
-            f"summary.ilike.%{safe}%,"
-            f"key_quote.ilike.%{safe}%,"
-            f"primary_topic.ilike.%{safe}%"
-        )
+        q = _text_search(q, text_search)
     if case_types:
         q = q.in_("case_type", case_types)
     if tones:
@@ -590,24 +708,23 @@ def count_calls(
         q = q.not_.is_("key_quote", "null").neq("key_quote", "")
     if content_worthy:
         q = q.eq("content_generation_flag", True)
-    return q.execute().count or 0
+    return q.limit(1).execute().count or 0
 
 
 # ---------------------------------------------------------------------------
 # Surfacing Ledger / NSM
 # ---------------------------------------------------------------------------
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_nsm_weekly_count() -> dict:
     """North Star Metric: unique angles surfaced this week vs last week.
 
     Returns dict with keys: this_week, last_week, delta.
     """
-    from datetime import datetime, timedelta, timezone
     client = get_supabase()
-    now = datetime.now(timezone.utc)
-    week_start = (now - timedelta(days=7)).isoformat()
-    prior_start = (now - timedelta(days=14)).isoformat()
+    now = _now_utc()
+    week_start = _ts(now - timedelta(days=7))
+    prior_start = _ts(now - timedelta(days=14))
 
     this_week_res = (
         client.table("surfacing_ledger")
@@ -641,11 +758,10 @@ def update_angle_feedback(
 
     Only updates rows still in 'surfaced' status (idempotent).
     """
-    from datetime import datetime, timezone
     client = get_supabase()
     data = {
         "usage_status": status,
-        "feedback_at": datetime.now(timezone.utc).isoformat(),
+        "feedback_at": _now_utc().isoformat(),
     }
     if comment:
         data["feedback_comment"] = comment
@@ -697,7 +813,6 @@ def get_ledger_detail(transcript_ids: tuple) -> dict:
 @st.cache_data(ttl=120)
 def get_feedback_stats() -> dict:
     """Return feedback stats: {total, reviewed, used_this_month}."""
-    from datetime import datetime, timedelta, timezone
     client = get_supabase()
 
     total_res = (
@@ -715,7 +830,7 @@ def get_feedback_stats() -> dict:
     )
     reviewed = reviewed_res.count or 0
 
-    month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
+    month_start = _ts(_now_utc().replace(day=1, hour=0, minute=0, second=0, microsecond=0))
     used_res = (
         client.table("surfacing_ledger")
         .select("source_transcript_id", count="exact")
@@ -728,15 +843,14 @@ def get_feedback_stats() -> dict:
     return {"total": total, "reviewed": reviewed, "used_this_month": used_this_month}
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_nsm_weekly_history(weeks: int = 6) -> list[dict]:
     """Return weekly angle counts for the last N weeks (for sparkline).
 
     Returns list of dicts: [{week_start: str, count: int}, ...]
     """
-    from datetime import datetime, timedelta, timezone
     client = get_supabase()
-    now = datetime.now(timezone.utc)
+    now = _now_utc()
     results = []
     for i in range(weeks - 1, -1, -1):
         week_end = now - timedelta(weeks=i)
@@ -744,8 +858,8 @@ def get_nsm_weekly_history(weeks: int = 6) -> list[dict]:
         res = (
             client.table("surfacing_ledger")
             .select("source_transcript_id", count="exact")
-            .gte("surfaced_at", week_start.isoformat())
-            .lt("surfaced_at", week_end.isoformat())
+            .gte("surfaced_at", _ts(week_start))
+            .lt("surfaced_at", _ts(week_end))
             .execute()
         )
         results.append({
@@ -755,6 +869,7 @@ def get_nsm_weekly_history(weeks: int = 6) -> list[dict]:
     return results
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def count_explorer_rows(
     case_types: list[str] | None = None,
     min_quality: int = 0,
@@ -779,4 +894,4 @@ def count_explorer_rows(
         q = q.gte("analyzed_at", start_date)
     if end_date:
         q = q.lte("analyzed_at", end_date)
-    return q.execute().count or 0
+    return q.limit(1).execute().count or 0
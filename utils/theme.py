@@ -1,11 +1,17 @@
 """Design tokens, global CSS, and theming utilities for Walker Brain Portal."""
 
+import html
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
 import streamlit as st
+from streamlit.components.v1 import html as _components_html
 
 # ---------------------------------------------------------------------------
 # Color palette — "Dark Authority, Warm Signal"
 # ---------------------------------------------------------------------------
-COLORS = {
+COLORS = MappingProxyType({
     "primary": "#D4A03C",
     "primary_light": "#E4B94E",
     "primary_dark": "#B8882E",
@@ -26,24 +32,18 @@ COLORS = {
     "text_on_primary": "#0F1117",
     "divider": "#2A2E3B",
     "border": "#2A2E3B",
-    # Tints for card backgrounds (subtle on dark)
-    "tint_primary": "rgba(212, 160, 60, 0.06)",
-    "tint_success": "rgba(0, 184, 148, 0.06)",
-    "tint_warning": "rgba(253, 203, 110, 0.06)",
-    "tint_error": "rgba(225, 112, 85, 0.06)",
+    # Plotly can't resolve CSS color-mix(); stylesheet tints are mixed in CSS
     "tint_primary_strong": "rgba(212, 160, 60, 0.12)",
-    "tint_primary_decorative": "rgba(212, 160, 60, 0.20)",
-    "tint_purple": "rgba(108, 92, 231, 0.06)",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Typography — DM Sans (body) + DM Serif Display (headlines/metrics)
 # ---------------------------------------------------------------------------
-TYPOGRAPHY = {
+TYPOGRAPHY = MappingProxyType({
     "font_family": "'DM Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif",
     "font_family_display": "'DM Serif Display', Georgia, 'Times New Roman', serif",
     "font_family_mono": "'JetBrains Mono', 'Fira Code', monospace",
-    "size": {
+    "size": MappingProxyType({
         "xs": "0.75rem",
         "sm": "0.8125rem",
         "base": "0.875rem",
@@ -52,30 +52,30 @@ TYPOGRAPHY = {
         "xl": "1.25rem",
         "2xl": "1.5rem",
         "3xl": "2.25rem",
-    },
-    "weight": {
+    }),
+    "weight": MappingProxyType({
         "normal": 400,
         "medium": 500,
         "semibold": 600,
         "bold": 700,
-    },
-    "line_height": {
+    }),
+    "line_height": MappingProxyType({
         "tight": 1.25,
         "normal": 1.5,
         "relaxed": 1.75,
-    },
-    "letter_spacing": {
+    }),
+    "letter_spacing": MappingProxyType({
         "tight": "-0.02em",
         "normal": "0",
         "wide": "0.03em",
         "wider": "0.06em",
-    },
-}
+    }),
+})
 
 # ---------------------------------------------------------------------------
 # Spacing (4px grid)
 # ---------------------------------------------------------------------------
-SPACING = {
+SPACING = MappingProxyType({
     "xs": "4px",
     "sm": "8px",
     "md": "12px",
@@ -83,26 +83,26 @@ SPACING = {
     "xl": "24px",
     "2xl": "32px",
     "3xl": "48px",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Shadows & Borders — higher opacity for dark backgrounds
 # ---------------------------------------------------------------------------
-SHADOWS = {
+SHADOWS = MappingProxyType({
     "sm": "0 1px 3px rgba(0,0,0,0.3), 0 1px 2px rgba(0,0,0,0.2)",
     "md": "0 4px 6px rgba(0,0,0,0.35), 0 2px 4px rgba(0,0,0,0.25)",
     "lg": "0 10px 15px rgba(0,0,0,0.4), 0 4px 6px rgba(0,0,0,0.3)",
     "glow_gold": "0 0 20px rgba(212, 160, 60, 0.15)",
     "glow_purple": "0 0 20px rgba(108, 92, 231, 0.15)",
-}
+})
 
-BORDERS = {
+BORDERS = MappingProxyType({
     "radius_sm": "8px",
     "radius_md": "12px",
     "radius_lg": "16px",
     "radius_xl": "20px",
     "radius_pill": "9999px",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Global CSS  (injected once per page via inject_theme())
@@ -113,26 +113,61 @@ _GOOGLE_FONTS_LINK = (
     '<link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap" rel="stylesheet">'
 )
 
-GLOBAL_CSS = f"""
-<style>
-/* --- Google Fonts --- */
-@import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap');
 
+def _build_css_tokens() -> dict[str, str]:
+    """Map each design token to a ``--wb-*`` name, e.g. --wb-color-primary.
+
+    Rules in GLOBAL_CSS_SRC are written against these names as
+    ``var(--wb-…)`` and resolved to literal values at import, so the shipped
+    stylesheet carries plain values (shorter than the var() references) and
+    the Python dicts stay the single source of truth.
+    """
+    tokens = {}
+    for prefix, group in (
+        ("color", COLORS), ("space", SPACING), ("shadow", SHADOWS), ("", BORDERS),
+    ):
+        for key, value in group.items():
+            name = f"{prefix}-{key}" if prefix else key
+            tokens[f"--wb-{name.replace('_', '-')}"] = value
+    for key in ("font_family", "font_family_display", "font_family_mono"):
+        tokens[f"--wb-{key.replace('font_family', 'font').replace('_', '-')}"] = TYPOGRAPHY[key]
+    for group, prefix in (
+        ("size", "font-size"), ("weight", "font-weight"),
+        ("line_height", "line-height"), ("letter_spacing", "letter-spacing"),
+    ):
+        for key, value in TYPOGRAPHY[group].items():
+            tokens[f"--wb-{prefix}-{key}"] = str(value)
+    return tokens
+
+
+_CSS_TOKENS = _build_css_tokens()
+
+
+def _resolve_tokens(css: str) -> str:
+    """Replace every var(--wb-…) reference with the token's literal value."""
+    return re.sub(r"var\((--wb-[\w-]+)\)", lambda m: _CSS_TOKENS[m.group(1)], css)
+
+
+GLOBAL_CSS_SRC = _resolve_tokens("""
+<style>
 /* --- Animated gold shimmer bar --- */
-@keyframes goldShimmer {{
-    0% {{ background-position: -200% center; }}
-    100% {{ background-position: 200% center; }}
-}}
+@keyframes goldShimmer {
+    0% { background-position: -200% center; }
+    100% { background-position: 200% center; }
+}
 
 /* --- Base typography & dark background --- */
-html, body, [class*="css"] {{
-    font-family: {TYPOGRAPHY["font_family"]};
-    background-color: {COLORS["background"]};
-    color: {COLORS["text_primary"]};
-}}
+:root {
+    color-scheme: dark;
+}
+body {
+    font-family: var(--wb-font);
+    background-color: var(--wb-color-background);
+    color: var(--wb-color-text-primary);
+}
 
 /* --- Gold shimmer header bar --- */
-.stApp::before {{
+.stApp::before {
     content: "";
     display: block;
     position: fixed;
@@ -142,605 +177,626 @@ html, body, [class*="css"] {{
     height: 3px;
     background: linear-gradient(
         90deg,
-        {COLORS["primary_dark"]},
-        {COLORS["primary"]},
-        {COLORS["primary_light"]},
-        {COLORS["primary"]},
-        {COLORS["primary_dark"]}
+        var(--wb-color-primary-dark),
+        var(--wb-color-primary),
+        var(--wb-color-primary-light),
+        var(--wb-color-primary),
+        var(--wb-color-primary-dark)
     );
     background-size: 200% auto;
     animation: goldShimmer 4s linear infinite;
     z-index: 9999;
-}}
+}
 
 /* --- Hide Streamlit chrome --- */
-#MainMenu {{visibility: hidden;}}
-footer {{visibility: hidden;}}
-[data-testid="stToolbar"] {{display: none !important;}}
-header[data-testid="stHeader"] {{
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+[data-testid="stToolbar"] {display: none !important;}
+header[data-testid="stHeader"] {
     background: transparent;
-}}
+}
 
 /* --- Sidebar polish --- */
-section[data-testid="stSidebar"] {{
-    background: {COLORS["surface_variant"]};
-    border-right: 1px solid {COLORS["divider"]};
-}}
-section[data-testid="stSidebar"] .stMarkdown h2 {{
-    font-size: {TYPOGRAPHY["size"]["md"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["text_primary"]};
-    margin-bottom: {SPACING["sm"]};
+section[data-testid="stSidebar"] {
+    background: var(--wb-color-surface-variant);
+    border-right: 1px solid var(--wb-color-divider);
+}
+section[data-testid="stSidebar"] .stMarkdown h2 {
+    font-size: var(--wb-font-size-md);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-text-primary);
+    margin-bottom: var(--wb-space-sm);
     letter-spacing: -0.01em;
-}}
+}
 
 /* --- Card / container styling --- */
-div[data-testid="stVerticalBlockBorderWrapper"] > div {{
-    border-radius: {BORDERS["radius_md"]} !important;
-    border-color: {COLORS["border"]} !important;
-}}
+div[data-testid="stVerticalBlockBorderWrapper"] > div {
+    border-radius: var(--wb-radius-md) !important;
+    border-color: var(--wb-color-border) !important;
+}
+
+/* --- Shared card surface --- */
+div[data-testid="stMetric"],
+details[data-testid="stExpander"],
+.wb-metric-card,
+.wb-quote-card,
+.wb-nav-card,
+.wb-empty-state,
+.wb-angle-card,
+.wb-nsm-billboard-zero {
+    background: var(--wb-color-surface);
+    box-shadow: var(--wb-shadow-sm);
+}
 
 /* --- Metric cards (native st.metric) --- */
-div[data-testid="stMetric"] {{
-    background: {COLORS["surface"]};
-    border-radius: {BORDERS["radius_md"]};
-    padding: {SPACING["md"]} {SPACING["lg"]};
-    box-shadow: {SHADOWS["sm"]};
-}}
-div[data-testid="stMetric"] label {{
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-    font-weight: {TYPOGRAPHY["weight"]["medium"]};
+div[data-testid="stMetric"] {
+    border-radius: var(--wb-radius-md);
+    padding: var(--wb-space-md) var(--wb-space-lg);
+}
+div[data-testid="stMetric"] label {
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+    font-weight: var(--wb-font-weight-medium);
     text-transform: uppercase;
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wide"]};
-}}
-div[data-testid="stMetric"] div[data-testid="stMetricValue"] {{
-    font-family: {TYPOGRAPHY["font_family_display"]};
-    font-weight: {TYPOGRAPHY["weight"]["bold"]};
-    color: {COLORS["text_primary"]};
-}}
+    letter-spacing: var(--wb-letter-spacing-wide);
+}
+div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
+    font-family: var(--wb-font-display);
+    font-weight: var(--wb-font-weight-bold);
+    color: var(--wb-color-text-primary);
+}
 
 /* --- Expanders --- */
-details[data-testid="stExpander"] {{
-    border: 1px solid {COLORS["border"]};
-    border-radius: {BORDERS["radius_md"]};
-    box-shadow: {SHADOWS["sm"]};
-    background: {COLORS["surface"]};
-}}
-details[data-testid="stExpander"] summary {{
-    font-weight: {TYPOGRAPHY["weight"]["medium"]};
-    color: {COLORS["text_primary"]};
-}}
+details[data-testid="stExpander"] {
+    border: 1px solid var(--wb-color-border);
+    border-radius: var(--wb-radius-md);
+}
+details[data-testid="stExpander"] summary {
+    font-weight: var(--wb-font-weight-medium);
+    color: var(--wb-color-text-primary);
+}
 
 /* --- Tabs --- */
-button[data-baseweb="tab"] {{
-    font-family: {TYPOGRAPHY["font_family"]};
-    font-weight: {TYPOGRAPHY["weight"]["medium"]};
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-}}
+button[data-baseweb="tab"] {
+    font-family: var(--wb-font);
+    font-weight: var(--wb-font-weight-medium);
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+}
 
 /* --- Buttons --- */
-button[data-testid="stBaseButton-primary"] {{
-    border-radius: {BORDERS["radius_sm"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    font-size: {TYPOGRAPHY["size"]["sm"]};
+button[data-testid="stBaseButton-primary"] {
+    border-radius: var(--wb-radius-sm);
+    font-weight: var(--wb-font-weight-semibold);
+    font-size: var(--wb-font-size-sm);
     letter-spacing: 0.01em;
-    box-shadow: {SHADOWS["sm"]};
+    box-shadow: var(--wb-shadow-sm);
     transition: box-shadow 0.15s ease;
-}}
+}
 
 /* --- Data tables --- */
-div[data-testid="stDataFrame"] {{
-    border-radius: {BORDERS["radius_md"]};
-    box-shadow: {SHADOWS["sm"]};
-}}
+div[data-testid="stDataFrame"] {
+    border-radius: var(--wb-radius-md);
+    box-shadow: var(--wb-shadow-sm);
+    overflow-x: auto !important;
+}
 
 /* --- Selectbox / multiselect / text input --- */
-div[data-baseweb="select"] {{
-    border-radius: {BORDERS["radius_sm"]} !important;
-}}
-input[data-testid="stTextInput"] {{
-    border-radius: {BORDERS["radius_sm"]} !important;
-}}
+div[data-baseweb="select"] {
+    border-radius: var(--wb-radius-sm) !important;
+}
+input[data-testid="stTextInput"] {
+    border-radius: var(--wb-radius-sm) !important;
+}
 
 /* --- Status badges (WCAG AA 4.5:1 contrast on dark surfaces) --- */
-.wb-badge {{
+.wb-badge {
     display: inline-block;
     padding: 2px 10px;
-    border-radius: {BORDERS["radius_pill"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wide"]};
+    border-radius: var(--wb-radius-pill);
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+    letter-spacing: var(--wb-letter-spacing-wide);
     text-transform: uppercase;
-}}
-.wb-badge-success {{ background: rgba(0, 184, 148, 0.15); color: #34EBC1; }}
-.wb-badge-warning {{ background: rgba(253, 203, 110, 0.15); color: #FDE68A; }}
-.wb-badge-error {{ background: rgba(225, 112, 85, 0.15); color: #F09080; }}
-.wb-badge-info {{ background: rgba(116, 185, 255, 0.15); color: #93CBFF; }}
-
-/* --- Soft horizontal divider --- */
-.wb-divider {{
+}
+.wb-badge[data-variant="success"] { background: color-mix(in srgb, var(--wb-color-success) 15%, transparent); color: #34EBC1; }
+.wb-badge[data-variant="warning"] { background: color-mix(in srgb, var(--wb-color-warning) 15%, transparent); color: #FDE68A; }
+.wb-badge[data-variant="error"] { background: color-mix(in srgb, var(--wb-color-error) 15%, transparent); color: #F09080; }
+.wb-badge[data-variant="info"] { background: color-mix(in srgb, var(--wb-color-info) 15%, transparent); color: #93CBFF; }
+
+/* --- Horizontal divider --- */
+.wb-divider {
     border: none;
     height: 1px;
-    background: linear-gradient(
-        to right,
-        transparent,
-        {COLORS["border"]},
-        transparent
-    );
-    margin: {SPACING["xl"]} 0;
-}}
+    background: var(--wb-color-border);
+    margin: var(--wb-space-xl) 0;
+}
 
 /* --- Section header --- */
-.wb-section-header {{
-    font-family: {TYPOGRAPHY["font_family"]};
-    font-size: {TYPOGRAPHY["size"]["lg"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["text_primary"]};
-    margin-top: {SPACING["xl"]};
-    margin-bottom: {SPACING["md"]};
-    padding-bottom: {SPACING["sm"]};
-    border-bottom: 2px solid {COLORS["primary"]};
+.wb-section-header {
+    font-family: var(--wb-font);
+    font-size: var(--wb-font-size-lg);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-text-primary);
+    margin-top: var(--wb-space-xl);
+    margin-bottom: var(--wb-space-md);
+    padding-bottom: var(--wb-space-sm);
+    border-bottom: 2px solid var(--wb-color-primary);
     display: inline-block;
     letter-spacing: -0.01em;
-}}
-.wb-section-subtitle {{
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-    margin-top: {SPACING["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["normal"]};
-}}
+}
+.wb-section-subtitle {
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+    margin-top: var(--wb-space-xs);
+    font-weight: var(--wb-font-weight-normal);
+}
 
 /* --- Metric card (custom HTML) --- */
-.wb-metric-card {{
-    background: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
-    border-radius: {BORDERS["radius_md"]};
-    padding: {SPACING["lg"]};
-    box-shadow: {SHADOWS["sm"]};
+.wb-metric-card {
+    border: 1px solid var(--wb-color-border);
+    border-radius: var(--wb-radius-md);
+    padding: var(--wb-space-lg);
     transition: box-shadow 0.2s ease;
-}}
-.wb-metric-card:hover {{
-    box-shadow: {SHADOWS["md"]}, {SHADOWS["glow_gold"]};
-}}
-.wb-metric-label {{
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["text_secondary"]};
-    margin-bottom: {SPACING["xs"]};
+}
+.wb-metric-card:hover {
+    box-shadow: var(--wb-shadow-md), var(--wb-shadow-glow-gold);
+}
+.wb-metric-label {
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-text-secondary);
+    margin-bottom: var(--wb-space-xs);
     white-space: nowrap;
     text-transform: uppercase;
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wide"]};
-}}
-.wb-metric-value {{
-    font-family: {TYPOGRAPHY["font_family_display"]};
-    font-size: clamp(1.25rem, 2.5vw, {TYPOGRAPHY["size"]["3xl"]});
-    font-weight: {TYPOGRAPHY["weight"]["bold"]};
-    line-height: {TYPOGRAPHY["line_height"]["tight"]};
+    letter-spacing: var(--wb-letter-spacing-wide);
+}
+.wb-metric-value {
+    font-family: var(--wb-font-display);
+    font-size: clamp(1.25rem, 2.5vw, var(--wb-font-size-3xl));
+    font-weight: var(--wb-font-weight-bold);
+    line-height: var(--wb-line-height-tight);
     margin-bottom: 2px;
-}}
-.wb-metric-delta {{
-    font-size: {TYPOGRAPHY["size"]["xs"]};
+}
+.wb-metric-delta {
+    font-size: var(--wb-font-size-xs);
     margin-top: 2px;
-}}
+}
 
 /* --- Quote card --- */
-.wb-quote-card {{
-    background: {COLORS["surface"]};
-    border-left: 3px solid {COLORS["primary"]};
-    border-radius: {BORDERS["radius_md"]};
-    padding: {SPACING["2xl"]};
-    box-shadow: {SHADOWS["sm"]};
-    margin-bottom: {SPACING["md"]};
+.wb-quote-card {
+    border-left: 3px solid var(--wb-color-primary);
+    border-radius: var(--wb-radius-md);
+    padding: var(--wb-space-2xl);
+    margin-bottom: var(--wb-space-md);
     position: relative;
-}}
-.wb-quote-card::before {{
+}
+.wb-quote-card::before {
     content: "\\201C";
     position: absolute;
     top: 12px;
     left: 16px;
-    font-family: {TYPOGRAPHY["font_family_display"]};
+    font-family: var(--wb-font-display);
     font-size: 3rem;
-    color: {COLORS["tint_primary_decorative"]};
+    color: color-mix(in srgb, var(--wb-color-primary) 20%, transparent);
     line-height: 1;
     pointer-events: none;
-}}
+}
 
 /* --- Badge pill row --- */
-.wb-pill-row {{
+.wb-pill-row {
     display: flex;
     flex-wrap: wrap;
     gap: 6px;
     align-items: center;
-    margin-top: {SPACING["sm"]};
-    margin-bottom: {SPACING["xs"]};
-}}
-.wb-quote-text {{
-    font-size: {TYPOGRAPHY["size"]["base"]};
+    margin-top: var(--wb-space-sm);
+    margin-bottom: var(--wb-space-xs);
+}
+.wb-quote-text {
+    font-size: var(--wb-font-size-base);
     font-style: italic;
-    color: {COLORS["text_primary"]};
-    line-height: {TYPOGRAPHY["line_height"]["relaxed"]};
-    margin-bottom: {SPACING["sm"]};
+    color: var(--wb-color-text-primary);
+    line-height: var(--wb-line-height-relaxed);
+    margin-bottom: var(--wb-space-sm);
     padding-left: 24px;
-}}
-.wb-quote-meta {{
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    color: {COLORS["text_secondary"]};
-}}
+}
+.wb-quote-meta {
+    font-size: var(--wb-font-size-xs);
+    color: var(--wb-color-text-secondary);
+}
 
 /* --- Nav card (landing page) --- */
-.wb-nav-card {{
-    background: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
-    border-radius: {BORDERS["radius_lg"]};
-    padding: {SPACING["xl"]};
-    box-shadow: {SHADOWS["sm"]};
+.wb-nav-card {
+    border: 1px solid var(--wb-color-border);
+    border-radius: var(--wb-radius-lg);
+    padding: var(--wb-space-xl);
     transition: box-shadow 0.2s ease, border-color 0.2s ease;
     text-align: center;
     min-height: 140px;
-}}
-.wb-nav-card:hover {{
-    box-shadow: {SHADOWS["md"]}, {SHADOWS["glow_gold"]};
-    border-color: {COLORS["primary"]};
-}}
-.wb-nav-icon {{
+}
+.wb-nav-card:hover {
+    box-shadow: var(--wb-shadow-md), var(--wb-shadow-glow-gold);
+    border-color: var(--wb-color-primary);
+}
+.wb-nav-icon {
     font-size: 2rem;
-    margin-bottom: {SPACING["sm"]};
-}}
-.wb-nav-title {{
-    font-size: {TYPOGRAPHY["size"]["md"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["text_primary"]};
-    margin-bottom: {SPACING["xs"]};
-}}
-.wb-nav-desc {{
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-    line-height: {TYPOGRAPHY["line_height"]["normal"]};
-}}
+    margin-bottom: var(--wb-space-sm);
+}
+.wb-nav-title {
+    font-size: var(--wb-font-size-md);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-text-primary);
+    margin-bottom: var(--wb-space-xs);
+}
+.wb-nav-desc {
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+    line-height: var(--wb-line-height-normal);
+}
 
 /* --- Login card --- */
-.wb-login-card {{
+.wb-login-card {
     max-width: 400px;
     margin: 48px auto 0 auto;
-    background: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
-    border-radius: {BORDERS["radius_lg"]};
-    padding: {SPACING["2xl"]} {SPACING["2xl"]} {SPACING["xl"]};
-    box-shadow: {SHADOWS["lg"]}, {SHADOWS["glow_gold"]};
+    background: var(--wb-color-surface);
+    border: 1px solid var(--wb-color-border);
+    border-radius: var(--wb-radius-lg);
+    padding: var(--wb-space-2xl) var(--wb-space-2xl) var(--wb-space-xl);
+    box-shadow: var(--wb-shadow-lg), var(--wb-shadow-glow-gold);
     text-align: center;
-}}
-.wb-login-title {{
-    font-family: {TYPOGRAPHY["font_family_display"]};
-    font-size: {TYPOGRAPHY["size"]["2xl"]};
-    font-weight: {TYPOGRAPHY["weight"]["bold"]};
-    color: {COLORS["text_primary"]};
-    margin-bottom: {SPACING["xs"]};
-}}
-.wb-login-subtitle {{
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-    margin-bottom: {SPACING["xl"]};
-}}
+}
+.wb-login-title {
+    font-family: var(--wb-font-display);
+    font-size: var(--wb-font-size-2xl);
+    font-weight: var(--wb-font-weight-bold);
+    color: var(--wb-color-text-primary);
+    margin-bottom: var(--wb-space-xs);
+}
+.wb-login-subtitle {
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+    margin-bottom: var(--wb-space-xl);
+}
 
 /* --- Kanban column header --- */
-.wb-kanban-header {{
-    border-radius: {BORDERS["radius_sm"]};
-    padding: {SPACING["sm"]} {SPACING["md"]};
+.wb-kanban-header {
+    border-radius: var(--wb-radius-sm);
+    padding: var(--wb-space-sm) var(--wb-space-md);
     text-align: center;
-    margin-bottom: {SPACING["sm"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-}}
+    margin-bottom: var(--wb-space-sm);
+    font-weight: var(--wb-font-weight-semibold);
+    font-size: var(--wb-font-size-sm);
+}
 
 /* --- Status pill --- */
-.wb-status-pill {{
+.wb-status-pill {
     display: inline-flex;
     align-items: center;
     gap: 6px;
     padding: 3px 12px;
-    border-radius: {BORDERS["radius_pill"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-}}
+    border-radius: var(--wb-radius-pill);
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+}
 
 /* --- Page title area --- */
-h1 {{
-    font-family: {TYPOGRAPHY["font_family_display"]} !important;
-    font-weight: {TYPOGRAPHY["weight"]["bold"]} !important;
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["tight"]} !important;
-    color: {COLORS["text_primary"]} !important;
-}}
+h1 {
+    font-family: var(--wb-font-display) !important;
+    font-weight: var(--wb-font-weight-bold) !important;
+    letter-spacing: var(--wb-letter-spacing-tight) !important;
+    color: var(--wb-color-text-primary) !important;
+}
 
 /* --- Code blocks --- */
-code {{
-    font-family: {TYPOGRAPHY["font_family_mono"]};
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-}}
+code {
+    font-family: var(--wb-font-mono);
+    font-size: var(--wb-font-size-sm);
+}
 
 /* --- Progress bars (agent scores) --- */
-div[data-testid="stProgress"] > div > div {{
+div[data-testid="stProgress"] > div > div {
     border-radius: 4px;
-}}
-
-/* --- Data table horizontal scroll --- */
-div[data-testid="stDataFrame"] {{
-    overflow-x: auto !important;
-}}
+}
 
 /* --- Code block overflow wrapping --- */
-div[data-testid="stCodeBlock"] pre {{
+div[data-testid="stCodeBlock"] pre {
     white-space: pre-wrap;
     word-wrap: break-word;
     max-height: 200px;
     overflow-y: auto;
-}}
+}
 
 /* --- Disabled button styling (pagination) --- */
-button[data-testid="stBaseButton-secondary"][disabled] {{
+button[data-testid="stBaseButton-secondary"][disabled] {
     opacity: 0.35;
     cursor: not-allowed;
-}}
+}
 
 /* --- Reduce top padding on main content area --- */
-.block-container {{
+.block-container {
     padding-top: 2rem !important;
-}}
+}
 
 /* --- Tab active indicator --- */
-button[data-baseweb="tab"][aria-selected="true"] {{
-    border-bottom: 3px solid {COLORS["primary"]} !important;
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]} !important;
-    color: {COLORS["text_primary"]} !important;
-}}
+button[data-baseweb="tab"][aria-selected="true"] {
+    border-bottom: 3px solid var(--wb-color-primary) !important;
+    font-weight: var(--wb-font-weight-semibold) !important;
+    color: var(--wb-color-text-primary) !important;
+}
 
 /* --- Sidebar nav link hover / active --- */
-section[data-testid="stSidebar"] a[data-testid="stSidebarNavLink"] {{
+:where(section[data-testid="stSidebar"]) a[data-testid="stSidebarNavLink"] {
     border-radius: 6px;
     transition: background-color 0.15s ease;
     border-left: 3px solid transparent;
-}}
-section[data-testid="stSidebar"] a[data-testid="stSidebarNavLink"]:hover {{
-    background-color: rgba(212, 160, 60, 0.06);
-    border-left-color: rgba(212, 160, 60, 0.3);
-}}
-section[data-testid="stSidebar"] a[data-testid="stSidebarNavLink"][aria-current="page"] {{
-    background-color: rgba(212, 160, 60, 0.10);
-    border-left-color: {COLORS["primary"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-}}
+}
+:where(section[data-testid="stSidebar"]) a[data-testid="stSidebarNavLink"]:hover {
+    background-color: color-mix(in srgb, var(--wb-color-primary) 6%, transparent);
+    border-left-color: color-mix(in srgb, var(--wb-color-primary) 30%, transparent);
+}
+:where(section[data-testid="stSidebar"]) a[data-testid="stSidebarNavLink"][aria-current="page"] {
+    background-color: color-mix(in srgb, var(--wb-color-primary) 10%, transparent);
+    border-left-color: var(--wb-color-primary);
+    font-weight: var(--wb-font-weight-semibold);
+}
 
 /* --- Empty state (standardized across all pages) --- */
-.wb-empty-state {{
-    padding: {SPACING["2xl"]} {SPACING["xl"]};
-    border: 1px dashed {COLORS["border"]};
-    border-radius: {BORDERS["radius_md"]};
-    background: {COLORS["surface"]};
+.wb-empty-state {
+    padding: var(--wb-space-2xl) var(--wb-space-xl);
+    border: 1px dashed var(--wb-color-border);
+    border-radius: var(--wb-radius-md);
     text-align: center;
-    box-shadow: {SHADOWS["sm"]};
-    margin-bottom: {SPACING["lg"]};
-}}
-.wb-empty-state-icon {{
+    margin-bottom: var(--wb-space-lg);
+}
+.wb-empty-state-icon {
     font-size: 1.8rem;
-    margin-bottom: {SPACING["md"]};
+    margin-bottom: var(--wb-space-md);
     opacity: 0.4;
-}}
-.wb-empty-state-text {{
-    font-size: {TYPOGRAPHY["size"]["base"]};
-    color: {COLORS["text_hint"]};
-    line-height: {TYPOGRAPHY["line_height"]["relaxed"]};
+}
+.wb-empty-state-text {
+    font-size: var(--wb-font-size-base);
+    color: var(--wb-color-text-hint);
+    line-height: var(--wb-line-height-relaxed);
     max-width: 400px;
     margin: 0 auto;
-}}
-.wb-empty-state-text strong {{
-    color: {COLORS["text_secondary"]};
-}}
+}
+.wb-empty-state-text strong {
+    color: var(--wb-color-text-secondary);
+}
 
 /* --- Angle card --- */
-.wb-angle-card {{
-    border: 1px solid {COLORS["border"]};
-    border-radius: {BORDERS["radius_md"]};
-    padding: {SPACING["lg"]} {SPACING["xl"]};
-    margin-bottom: {SPACING["xs"]};
-    background: {COLORS["surface"]};
-    box-shadow: {SHADOWS["sm"]};
-}}
-.wb-angle-card:hover {{
-    box-shadow: {SHADOWS["md"]};
-}}
-.wb-angle-badges {{
-    margin-bottom: {SPACING["sm"]};
-}}
-.wb-angle-title {{
+.wb-angle-card {
+    border: 1px solid var(--wb-color-border);
+    border-radius: var(--wb-radius-md);
+    padding: var(--wb-space-lg) var(--wb-space-xl);
+    margin-bottom: var(--wb-space-xs);
+}
+.wb-angle-card:hover {
+    box-shadow: var(--wb-shadow-md);
+}
+.wb-angle-badges {
+    margin-bottom: var(--wb-space-sm);
+}
+.wb-angle-title {
     font-size: 1.05rem;
-    font-weight: {TYPOGRAPHY["weight"]["bold"]};
-    color: {COLORS["text_primary"]};
+    font-weight: var(--wb-font-weight-bold);
+    color: var(--wb-color-text-primary);
     margin-bottom: 6px;
-}}
-.wb-angle-summary {{
-    font-size: {TYPOGRAPHY["size"]["base"]};
-    color: {COLORS["text_secondary"]};
-    line-height: {TYPOGRAPHY["line_height"]["normal"]};
-}}
-.wb-angle-section-label {{
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["text_secondary"]};
-    margin-bottom: {SPACING["xs"]};
+}
+.wb-angle-summary {
+    font-size: var(--wb-font-size-base);
+    color: var(--wb-color-text-secondary);
+    line-height: var(--wb-line-height-normal);
+}
+.wb-angle-section-label {
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-text-secondary);
+    margin-bottom: var(--wb-space-xs);
     text-transform: uppercase;
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wide"]};
-}}
-.wb-angle-quotes {{
+    letter-spacing: var(--wb-letter-spacing-wide);
+}
+.wb-angle-quotes {
     margin-top: 10px;
-}}
-.wb-angle-quotes li {{
+}
+.wb-angle-quotes li {
     margin-bottom: 6px;
     font-style: italic;
-    color: {COLORS["text_secondary"]};
-    font-size: {TYPOGRAPHY["size"]["base"]};
-}}
-.wb-angle-arc {{
+    color: var(--wb-color-text-secondary);
+    font-size: var(--wb-font-size-base);
+}
+.wb-angle-arc {
     margin-top: 10px;
-    padding: {SPACING["sm"]} {SPACING["md"]};
-    background: {COLORS["surface_elevated"]};
-    border-radius: {BORDERS["radius_sm"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-}}
-.wb-angle-why {{
+    padding: var(--wb-space-sm) var(--wb-space-md);
+    background: var(--wb-color-surface-elevated);
+    border-radius: var(--wb-radius-sm);
+    font-size: var(--wb-font-size-xs);
+}
+.wb-angle-why {
     margin-top: 10px;
-    font-size: {TYPOGRAPHY["size"]["base"]};
-    color: {COLORS["text_secondary"]};
-}}
-.wb-angle-meta {{
-    margin-top: {SPACING["sm"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    color: {COLORS["text_hint"]};
-}}
+    font-size: var(--wb-font-size-base);
+    color: var(--wb-color-text-secondary);
+}
+.wb-angle-meta {
+    margin-top: var(--wb-space-sm);
+    font-size: var(--wb-font-size-xs);
+    color: var(--wb-color-text-hint);
+}
 
 /* --- NSM Banner --- */
-.wb-nsm-banner {{
+.wb-nsm-banner {
     display: flex;
     align-items: center;
-    gap: {SPACING["md"]};
-    padding: {SPACING["md"]} {SPACING["xl"]};
-    background: linear-gradient(90deg, rgba(212,160,60,0.10) 0%, transparent 100%);
-    border-left: 3px solid {COLORS["primary"]};
-    border-radius: {BORDERS["radius_sm"]};
-    margin-bottom: {SPACING["md"]};
-}}
-.wb-nsm-value {{
-    font-family: {TYPOGRAPHY["font_family_display"]};
+    gap: var(--wb-space-md);
+    padding: var(--wb-space-md) var(--wb-space-xl);
+    background: linear-gradient(90deg, color-mix(in srgb, var(--wb-color-primary) 10%, transparent) 0%, transparent 100%);
+    border-left: 3px solid var(--wb-color-primary);
+    border-radius: var(--wb-radius-sm);
+    margin-bottom: var(--wb-space-md);
+}
+.wb-nsm-value {
+    font-family: var(--wb-font-display);
     font-size: 1.5rem;
-    font-weight: {TYPOGRAPHY["weight"]["bold"]};
-    color: {COLORS["primary"]};
-}}
-.wb-nsm-label {{
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
-    font-weight: {TYPOGRAPHY["weight"]["medium"]};
-}}
-.wb-nsm-billboard {{
-    background: linear-gradient(135deg, {COLORS["surface"]} 0%, rgba(212,160,60,0.08) 100%);
-    border: 1px solid rgba(212,160,60,0.25);
-    border-left: 4px solid {COLORS["primary"]};
-    border-radius: {BORDERS["radius_lg"]};
-    padding: {SPACING["xl"]};
-    box-shadow: {SHADOWS["md"]}, {SHADOWS["glow_gold"]};
-}}
-.wb-nsm-billboard-zero {{
-    background: {COLORS["surface"]};
-    border: 1px dashed {COLORS["border"]};
-    border-left: 4px solid {COLORS["text_hint"]};
-    border-radius: {BORDERS["radius_lg"]};
-    padding: {SPACING["xl"]};
-    box-shadow: {SHADOWS["sm"]};
-}}
+    font-weight: var(--wb-font-weight-bold);
+    color: var(--wb-color-primary);
+}
+.wb-nsm-label {
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
+    font-weight: var(--wb-font-weight-medium);
+}
+.wb-nsm-billboard {
+    background: linear-gradient(135deg, var(--wb-color-surface) 0%, color-mix(in srgb, var(--wb-color-primary) 8%, transparent) 100%);
+    border: 1px solid color-mix(in srgb, var(--wb-color-primary) 25%, transparent);
+    border-left: 4px solid var(--wb-color-primary);
+    border-radius: var(--wb-radius-lg);
+    padding: var(--wb-space-xl);
+    box-shadow: var(--wb-shadow-md), var(--wb-shadow-glow-gold);
+}
+.wb-nsm-billboard-zero {
+    border: 1px dashed var(--wb-color-border);
+    border-left: 4px solid var(--wb-color-text-hint);
+    border-radius: var(--wb-radius-lg);
+    padding: var(--wb-space-xl);
+}
 
 /* --- Feedback pill --- */
-.wb-feedback-pill {{
+.wb-feedback-pill {
     display: inline-flex;
     align-items: center;
     gap: 6px;
-    padding: 5px {SPACING["lg"]};
-    border-radius: {BORDERS["radius_pill"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wide"]};
+    padding: 5px var(--wb-space-lg);
+    border-radius: var(--wb-radius-pill);
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+    letter-spacing: var(--wb-letter-spacing-wide);
     text-transform: uppercase;
-}}
-.wb-feedback-comment {{
-    margin: 6px 0 {SPACING["sm"]} 0;
-    padding: {SPACING["sm"]} 14px;
-    background: {COLORS["surface_elevated"]};
-    border-left: 3px solid {COLORS["border"]};
+}
+.wb-feedback-comment {
+    margin: 6px 0 var(--wb-space-sm) 0;
+    padding: var(--wb-space-sm) 14px;
+    background: var(--wb-color-surface-elevated);
+    border-left: 3px solid var(--wb-color-border);
     border-radius: 6px;
-    font-size: {TYPOGRAPHY["size"]["sm"]};
-    color: {COLORS["text_secondary"]};
+    font-size: var(--wb-font-size-sm);
+    color: var(--wb-color-text-secondary);
     font-style: italic;
-    line-height: {TYPOGRAPHY["line_height"]["normal"]};
-}}
+    line-height: var(--wb-line-height-normal);
+}
 
 /* --- Target badge --- */
-.wb-target-badge {{
+.wb-target-badge {
     display: inline-block;
-    padding: 3px {SPACING["md"]};
-    border-radius: {BORDERS["radius_pill"]};
-    font-size: {TYPOGRAPHY["size"]["xs"]};
-    font-weight: {TYPOGRAPHY["weight"]["semibold"]};
-    color: {COLORS["primary_light"]};
-    background: rgba(212,160,60,0.12);
+    padding: 3px var(--wb-space-md);
+    border-radius: var(--wb-radius-pill);
+    font-size: var(--wb-font-size-xs);
+    font-weight: var(--wb-font-weight-semibold);
+    color: var(--wb-color-primary-light);
+    background: color-mix(in srgb, var(--wb-color-primary) 12%, transparent);
     letter-spacing: 0.04em;
     text-transform: uppercase;
-}}
+}
 
 /* --- Sidebar wordmark --- */
-.wb-sidebar-wordmark {{
-    margin-bottom: {SPACING["lg"]};
-    padding-bottom: {SPACING["md"]};
-    border-bottom: 1px solid {COLORS["divider"]};
-}}
-.wb-sidebar-wordmark .wb-wm-walker {{
-    font-family: {TYPOGRAPHY["font_family"]};
+.wb-sidebar-wordmark {
+    margin-bottom: var(--wb-space-lg);
+    padding-bottom: var(--wb-space-md);
+    border-bottom: 1px solid var(--wb-color-divider);
+}
+.wb-sidebar-wordmark .wb-wm-walker {
+    font-family: var(--wb-font);
     font-weight: 700;
     font-size: 1.1rem;
-    letter-spacing: {TYPOGRAPHY["letter_spacing"]["wider"]};
-    color: {COLORS["text_primary"]};
+    letter-spacing: var(--wb-letter-spacing-wider);
+    color: var(--wb-color-text-primary);
     text-transform: uppercase;
     white-space: nowrap;
     overflow: hidden;
     text-overflow: ellipsis;
-}}
-.wb-sidebar-wordmark .wb-wm-brain {{
-    font-family: {TYPOGRAPHY["font_family_display"]};
+}
+.wb-sidebar-wordmark .wb-wm-brain {
+    font-family: var(--wb-font-display);
     font-style: italic;
     font-size: 1.1rem;
-    color: {COLORS["primary"]};
+    color: var(--wb-color-primary);
     margin-left: 4px;
     white-space: nowrap;
-}}
+}
 </style>
-"""
+""")
+
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace; the stylesheet is re-sent every rerun."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+
+# GLOBAL_CSS_SRC stays readable for debugging; the minified copy is what ships.
+_GLOBAL_CSS_MIN = _minify_css(GLOBAL_CSS_SRC)
+
+# Fonts link + stylesheet, built once at import and emitted as one element.
+_THEME_BLOB = _GOOGLE_FONTS_LINK + _GLOBAL_CSS_MIN
 
 # ---------------------------------------------------------------------------
 # Plotly template (shared across all charts)
 # ---------------------------------------------------------------------------
-PLOTLY_TEMPLATE = dict(
-    font_family="DM Sans",
-    font_color=COLORS["text_secondary"],
-    font_size=12,
-    title_font_size=14,
-    title_font_color=COLORS["text_primary"],
-    paper_bgcolor="rgba(0,0,0,0)",
-    plot_bgcolor="rgba(0,0,0,0)",
-    xaxis=dict(
-        gridcolor=COLORS["border"],
-        linecolor=COLORS["border"],
-        zerolinecolor=COLORS["border"],
-        title_font_size=12,
-        tickfont_size=11,
-    ),
-    yaxis=dict(
-        gridcolor=COLORS["border"],
-        linecolor=COLORS["border"],
-        zerolinecolor=COLORS["border"],
-        title_font_size=12,
-        tickfont_size=11,
-    ),
-    colorway=[
-        COLORS["primary"], COLORS["secondary"], COLORS["accent"],
-        COLORS["info"], COLORS["error"], COLORS["warning"],
-        "#A29BFE", "#FD79A8", "#FFEAA7", "#55EFC4",
-    ],
-    hoverlabel=dict(
-        bgcolor=COLORS["surface_variant"],
-        font_size=12,
-        font_family="DM Sans",
-        font_color=COLORS["text_primary"],
-    ),
-    margin=dict(l=40, r=20, t=30, b=40),
+# First family in the CSS stack, e.g. "DM Sans"; Plotly takes a single name.
+_PRIMARY_FONT = TYPOGRAPHY["font_family"].split(",", 1)[0].strip("'")
+
+# Categorical series colors, resolved once; charts index into it directly.
+PLOTLY_COLORWAY: tuple[str, ...] = (
+    COLORS["primary"], COLORS["secondary"], COLORS["accent"],
+    COLORS["info"], COLORS["error"], COLORS["warning"],
+    "#A29BFE", "#FD79A8", "#FFEAA7", "#55EFC4",
 )
 
+
+def _build_plotly_template() -> dict:
+    return dict(
+        font_family=_PRIMARY_FONT,
+        font_color=COLORS["text_secondary"],
+        font_size=12,
+        title_font_size=14,
+        title_font_color=COLORS["text_primary"],
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(
+            gridcolor=COLORS["border"],
+            linecolor=COLORS["border"],
+            zerolinecolor=COLORS["border"],
+            title_font_size=12,
+            tickfont_size=11,
+        ),
+        yaxis=dict(
+            gridcolor=COLORS["border"],
+            linecolor=COLORS["border"],
+            zerolinecolor=COLORS["border"],
+            title_font_size=12,
+            tickfont_size=11,
+        ),
+        colorway=list(PLOTLY_COLORWAY),
+        hoverlabel=dict(
+            bgcolor=COLORS["surface_variant"],
+            font_size=12,
+            font_family=_PRIMARY_FONT,
+            font_color=COLORS["text_primary"],
+        ),
+        margin=dict(l=40, r=20, t=30, b=40),
+    )
+
+
+def __getattr__(name: str):
+    # PLOTLY_TEMPLATE is built on first access (PEP 562), so pages without
+    # charts never pay for it; afterwards it is an ordinary module global.
+    if name == "PLOTLY_TEMPLATE":
+        globals()[name] = _build_plotly_template()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------------------------------------------------------
 # Theme injection (call once per page, before any content)
 # ---------------------------------------------------------------------------
@@ -749,10 +805,10 @@ def inject_theme():
 
     Streamlit rebuilds the entire HTML on each rerun, so the CSS must be
     injected every time — a session-state guard would cause the styles to
-    disappear after the first interaction.
+    disappear after the first interaction. This stays on st.markdown: st.html
+    sanitizes its input and would drop the fonts <link> tags.
     """
-    st.markdown(_GOOGLE_FONTS_LINK, unsafe_allow_html=True)
-    st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
+    st.markdown(_THEME_BLOB, unsafe_allow_html=True)
 
 
 # ---------------------------------------------------------------------------
@@ -760,16 +816,25 @@ def inject_theme():
 # ---------------------------------------------------------------------------
 
 def styled_divider():
-    """Render a soft gradient divider (replaces st.markdown('---'))."""
-    st.markdown('<hr class="wb-divider">', unsafe_allow_html=True)
+    """Render a thin themed divider (replaces st.markdown('---'))."""
+    st.html('<hr class="wb-divider">')
+
+
+_HDR_TPL = '<div class="wb-section-header">{t}</div>'
+_SUB_TPL = '<div class="wb-section-subtitle">{s}</div>'
+
+
+@lru_cache(maxsize=256)
+def _render_header_html(text: str, subtitle: str | None) -> str:
+    parts = [_HDR_TPL.format(t=html.escape(text))]
+    if subtitle:
+        parts.append(_SUB_TPL.format(s=html.escape(subtitle)))
+    return "".join(parts)
 
 
 def styled_header(text: str, subtitle: str | None = None):
     """Render a branded section header with optional subtitle."""
-    html = f'<div class="wb-section-header">{text}</div>'
-    if subtitle:
-        html += f'<div class="wb-section-subtitle">{subtitle}</div>'
-    st.markdown(html, unsafe_allow_html=True)
+    st.html(_render_header_html(text, subtitle))
 
 
 def inject_plotly_title_fix():
@@ -777,31 +842,67 @@ def inject_plotly_title_fix():
 
     Streamlit's HTML sanitizer strips CSS rules targeting SVG elements inside
     Plotly charts, so we use st.components.v1.html() to bypass the sanitizer
-    and inject a MutationObserver that hides any .g-gtitle element whose text
-    reads 'undefined'.  Call once per page that renders Plotly charts.
+    and inject a script that hides any .g-gtitle element whose text reads
+    'undefined'.  CSS alone can't do it — no selector matches on text content.
+    Each chart container gets its own observer, disconnected once its title
+    layer has been handled.  Call once per page that renders Plotly charts.
     """
-    import streamlit.components.v1 as components
-    components.html(
+    _components_html(
         """
         <script>
         (function() {
-            function hideUndefinedTitles() {
-                var titles = window.parent.document.querySelectorAll('.g-gtitle');
+            var doc = window.parent.document;
+            var CHART = 'div[data-testid="stPlotlyChart"]';
+            // Scan in the parent's idle time, but never wait more than 2s behind Plotly
+            var ric = window.parent.requestIdleCallback;
+            var idle = ric
+                ? function(cb) { return ric.call(window.parent, cb, { timeout: 2000 }); }
+                : function(cb) { return setTimeout(cb, 50); };
+
+            // Returns true once the chart's title layer has rendered.
+            function fixTitles(chart) {
+                var titles = chart.querySelectorAll('.g-gtitle');
                 for (var i = 0; i < titles.length; i++) {
                     var txt = titles[i].textContent || '';
                     if (txt.trim() === 'undefined') {
                         titles[i].style.display = 'none';
                     }
                 }
+                return titles.length > 0;
             }
-            // Run immediately and also observe for dynamic chart renders
-            hideUndefinedTitles();
-            var observer = new MutationObserver(function() { hideUndefinedTitles(); });
-            observer.observe(window.parent.document.body, { childList: true, subtree: true });
-            // Also run on a short delay to catch late Plotly renders
-            setTimeout(hideUndefinedTitles, 1000);
-            setTimeout(hideUndefinedTitles, 3000);
-            setTimeout(hideUndefinedTitles, 5000);
+            // One observer per chart, scoped to its subtree and dropped after the first hit
+            function watch(chart) {
+                if (chart.dataset.wbTitleFixed) return;
+                if (fixTitles(chart)) { chart.dataset.wbTitleFixed = '1'; return; }
+                var pending = false;
+                var observer = new MutationObserver(function() {
+                    if (pending) return;
+                    pending = true;
+                    idle(function() {
+                        pending = false;
+                        if (fixTitles(chart)) {
+                            chart.dataset.wbTitleFixed = '1';
+                            observer.disconnect();
+                        }
+                    });
+                });
+                observer.observe(chart, { childList: true, subtree: true });
+            }
+            var charts = doc.querySelectorAll(CHART);
+            for (var i = 0; i < charts.length; i++) watch(charts[i]);
+            // Charts mounted later: inspect only the added nodes, never the whole page
+            new MutationObserver(function(mutations) {
+                for (var m = 0; m < mutations.length; m++) {
+                    var added = mutations[m].addedNodes;
+                    for (var n = 0; n < added.length; n++) {
+                        var node = added[n];
+                        if (node.nodeType !== 1) continue;
+                        if (node.matches(CHART)) { watch(node); continue; }
+                        var inner = node.querySelectorAll(CHART);
+                        for (var k = 0; k < inner.length; k++) watch(inner[k]);
+                    }
+                }
+            }).observe(doc.body, { childList: true, subtree: true });
         })();
         </script>
         """,
@@ -810,16 +911,24 @@ def inject_plotly_title_fix():
     )
 
 
+_EMPTY_STATE_TPL = (
+    '<div class="wb-empty-state">'
+    '<div class="wb-empty-state-icon">{icon}</div>'
+    '<div class="wb-empty-state-text">{message}{detail}</div>'
+    '</div>'
+)
+
+
 def empty_state(icon: str, message: str, detail: str = ""):
     """Render a standardized empty state with icon, message, and optional detail.
 
     Uses the .wb-empty-state CSS class for consistent styling across all pages.
     """
-    detail_html = f"<strong>{detail}</strong>" if detail else ""
     st.markdown(
-        f'<div class="wb-empty-state">'
-        f'<div class="wb-empty-state-icon">{icon}</div>'
-        f'<div class="wb-empty-state-text">{message} {detail_html}</div>'
-        f'</div>',
+        _EMPTY_STATE_TPL.format(
+            icon=icon,
+            message=message,
+            detail=f" <strong>{detail}</strong>" if detail else "",
+        ),
         unsafe_allow_html=True,
     )